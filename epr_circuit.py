@@ -1,4 +1,5 @@
 from manim import *
+from epr_example.circuit_wires import WireSet
 
 # TODO 5/12: need to fix CNOT gate-- there's too much space on the right hand side of the gates
 
@@ -23,30 +24,25 @@ class CleanGrowingEPR(Scene):
             label = MathTex(qubit_labels[i]).next_to([x_start, y, 0], LEFT)
             self.play(Write(label))
 
-        # Track current X position of the wire tips per qubit
-        current_xs = {i: x_start for i in range(2)}
-
-        # Go through each time step and build the circuit
+        # One path per wire for the whole circuit, each wire running one gate spacing past the last time step,
+        # with a gap around each gate box and on the right-hand side of the CNOT
+        wire_end = time_steps[-1] + gate_spacing
+        wire_gaps = {i: [] for i in range(2)}
+        for t, step in gates.items():
+            x = time_steps[t]
+            for i in step:
+                wire_gaps[i].append((x, x + gate_width / 2) if step.get(0) == "C" else (x - gate_width / 2, x + gate_width / 2))
+        wire_edges = [[x_start] + [x for gap in sorted(wire_gaps[i]) for x in gap] + [wire_end] for i in range(2)]
+        wires = WireSet(qubit_ys, [np.reshape(edges, (-1, 2)) for edges in wire_edges])
+        self.add(wires)
+
+        # Go through each time step and build the circuit, one play per step
         for t in range(1, len(time_steps)):
-            x_prev = time_steps[t - 1]
             x_curr = time_steps[t]
+            step = gates.get(t, {})
+            animations = []
 
-            # Check if this step is a CNOT
-            is_cnot = (
-                t in gates and 
-                0 in gates[t] and gates[t][0] == "C" and 
-                1 in gates[t] and gates[t][1] == "X"
-            )
-
-            if is_cnot:
-                # === Draw wires around CNOT ===
-                for i, y in enumerate(qubit_ys):
-                    wire_left = Line([current_xs[i], y, 0], [x_curr - gate_width / 2, y, 0])
-                    wire_right = Line([x_curr + gate_width / 2, y, 0], [x_curr + gate_spacing, y, 0])
-                    self.play(Create(wire_left))
-                    current_xs[i] = x_curr + gate_spacing  # update tracker
-                    # defer right side wire until after gate for better animation timing
-
+            if step.get(0) == "C" and step.get(1) == "X":
                 # === CNOT construction ===
                 control_y = qubit_ys[0]
                 target_y = qubit_ys[1]
@@ -54,41 +50,19 @@ class CleanGrowingEPR(Scene):
                 target_circle = Circle(radius=0.2).move_to([x_curr, target_y, 0])
                 target_line = Line([x_curr, target_y - 0.2, 0], [x_curr, target_y + 0.2, 0])
                 connector = Line([x_curr, control_y, 0], [x_curr, target_y, 0])
+                animations.append(AnimationGroup(Create(connector), FadeIn(control_dot), Create(target_circle), Create(target_line)))
 
-                self.play(Create(connector), FadeIn(control_dot), Create(target_circle), Create(target_line))
-                self.bring_to_front(control_dot, target_circle, target_line)
-
-                # Now draw right-side wires
-                for i, y in enumerate(qubit_ys):
-                    wire_right = Line([x_curr + gate_width / 2, y, 0], [x_curr + gate_spacing, y, 0])
-                    self.play(Create(wire_right))
-
-                continue  # skip individual gate drawing logic for this step
-
-            # === Regular gate or no gate ===
-            for i, y in enumerate(qubit_ys):
-                has_gate = (t in gates) and (i in gates[t])
-
-                if has_gate:
-                    # Wire → gate → wire
-                    wire_left = Line([current_xs[i], y, 0], [x_curr - gate_width / 2, y, 0])
-                    self.play(Create(wire_left))
-
-                    gate_type = gates[t][i]
+            elif step:
+                # Wire → gate → wire
+                animations.append(wires.grow(x_curr - gate_width / 2))
+                for i, gate_type in step.items():
                     if gate_type == "H":
-                        gate = Square(gate_width).move_to([x_curr, y, 0])
+                        gate = Square(gate_width).move_to([x_curr, qubit_ys[i], 0])
                         label = MathTex("H").move_to(gate)
-                        self.play(Create(gate), Write(label))
-                        self.bring_to_front(gate, label)
-
-                    wire_right = Line([x_curr + gate_width / 2, y, 0], [x_curr + gate_spacing, y, 0])
-                    self.play(Create(wire_right))
-                    current_xs[i] = x_curr + gate_spacing
+                        animations.append(AnimationGroup(Create(gate), Write(label)))
 
-                else:
-                    # No gate → uninterrupted wire
-                    wire = Line([current_xs[i], y, 0], [x_curr + gate_spacing, y, 0])
-                    self.play(Create(wire))
-                    current_xs[i] = x_curr + gate_spacing
+            # Every wire on to the next time step at once
+            animations.append(wires.grow(x_curr + gate_spacing))
+            self.play(Succession(*animations))
 
         self.wait(2)
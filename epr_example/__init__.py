@@ -0,0 +1 @@
+"""Quantum representation scenes and the simulation engines behind them"""
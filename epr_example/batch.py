@@ -0,0 +1,97 @@
+import numpy as np
+from epr_example.statevector import num_qubits_of, gate_matrix, NON_UNITARY
+from epr_example.trajectory import circuit_instructions
+
+# Batched statevector simulation.
+#
+# A batch of B circuits on the same register is evolved as one (B, 2^n) array.
+# At every time step the rows are grouped by the qubits their instruction acts
+# on, and each group is updated with a single einsum using one stacked matrix
+# per row, so a parameter sweep over B angles costs one vectorized pass instead
+# of B separate simulations.
+
+
+def apply_gate_batch(states, matrices, qubits):
+    """Applies a k-qubit gate to the same qubits of every row of a (B, 2^n) batch.
+
+    `matrices` is either one (2^k, 2^k) matrix shared by all rows or a stack of
+    shape (B, 2^k, 2^k) with one matrix per row.
+    """
+    states = np.asarray(states, dtype=complex)
+    batch, n = states.shape[0], num_qubits_of(states)
+    qubits = list(qubits)
+    k = len(qubits)
+
+    # Move the target axes to the back so the gate acts on the trailing 2^k index
+    psi = states.reshape((batch,) + (2,) * n)
+    targets = [q + 1 for q in qubits]
+    psi = np.moveaxis(psi, targets, list(range(n + 1 - k, n + 1)))
+    moved_shape = psi.shape
+    psi = psi.reshape(batch, -1, 2 ** k)
+
+    matrices = np.asarray(matrices, dtype=complex)
+    subscripts = "ij,brj->bri" if matrices.ndim == 2 else "bij,brj->bri"
+    psi = np.einsum(subscripts, matrices, psi)
+
+    psi = np.moveaxis(psi.reshape(moved_shape), list(range(n + 1 - k, n + 1)), targets)
+    return psi.reshape(batch, -1)
+
+
+def _initial_batch(batch, num_qubits):
+    states = np.zeros((batch, 2 ** num_qubits), dtype=complex)
+    states[:, 0] = 1
+    return states
+
+
+def simulate_instruction_batch(num_qubits, programs, return_steps=False):
+    """Evolves many instruction lists (see trajectory.circuit_instructions) on one register together.
+
+    Returns the final (B, 2^n) states, or every step as (T + 1, B, 2^n) when
+    return_steps is set; shorter programs simply hold their last state.
+    """
+    programs = [list(program) for program in programs]
+    states = _initial_batch(len(programs), num_qubits)
+    steps = [states]
+    matrix_cache = {}
+
+    for t in range(max((len(program) for program in programs), default=0)):
+        # Group the rows with a gate at this step by the qubits it acts on
+        groups = {}
+        for row, program in enumerate(programs):
+            if t >= len(program):
+                continue
+            name, qubits, _, params = program[t]
+            if name in NON_UNITARY:
+                continue
+            key = (name, params)
+            if key not in matrix_cache:
+                matrix_cache[key] = gate_matrix(name, params)
+            groups.setdefault(qubits, ([], []))
+            groups[qubits][0].append(row)
+            groups[qubits][1].append(matrix_cache[key])
+
+        states = states.copy()
+        for qubits, (rows, matrices) in groups.items():
+            if len(rows) == len(programs) and all(m is matrices[0] for m in matrices):
+                states = apply_gate_batch(states, matrices[0], qubits)
+            else:
+                states[rows] = apply_gate_batch(states[rows], np.stack(matrices), qubits)
+        if return_steps:
+            steps.append(states)
+
+    return np.stack(steps) if return_steps else states
+
+
+def simulate_batch(circuits, return_steps=False):
+    """Simulates a batch of QuantumCircuits with the same number of qubits in one vectorized pass"""
+    num_qubits = {qc.num_qubits for qc in circuits}
+    if len(num_qubits) != 1:
+        raise ValueError(f"All circuits in a batch need the same number of qubits, got {sorted(num_qubits)}.")
+    programs = [circuit_instructions(qc) for qc in circuits]
+    return simulate_instruction_batch(num_qubits.pop(), programs, return_steps)
+
+
+def sweep(qc, parameter, values, return_steps=False):
+    """Simulates one parameterized circuit for every value of `parameter` as a single batch"""
+    circuits = [qc.assign_parameters({parameter: value}) for value in values]
+    return simulate_batch(circuits, return_steps)
@@ -0,0 +1,166 @@
+from manim import *
+from epr_example.tex_cache import CounterText
+import numpy as np
+import math
+from qiskit import QuantumCircuit
+from epr_example.trajectory import get_trajectory
+from epr_example.bloch_rotation import trajectory_tracks
+
+# Bloch grid: one small Bloch sphere per qubit, for registers far wider than
+# the two spheres the other scenes draw side by side.
+#
+# Each cell is a flat projection of a sphere (outline + equator), built once
+# and copied per qubit. Every state arrow lives in a single VMobject whose
+# points are rewritten with one vectorized pass per frame, so moving 64 arrows
+# costs about as much as moving one.
+
+# Same view direction as the 3D scenes' set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
+GRID_PHI = 70 * DEGREES
+GRID_THETA = 30 * DEGREES
+
+
+def projection_matrix(phi=GRID_PHI, theta=GRID_THETA):
+    """2x3 matrix taking Bloch (x, y, z) to the screen, as ThreeDCamera would"""
+    rotation = rotation_matrix(-phi, RIGHT) @ rotation_matrix(-theta - 90 * DEGREES, OUT)
+    return rotation[:2]
+
+
+def _segments(starts, ends):
+    """Cubic Bezier control points of straight segments, shape (k * 4, 3)"""
+    thirds = np.array([0, 1, 2, 3])[None, :, None] / 3
+    points = starts[:, None, :] + thirds * (ends - starts)[:, None, :]
+    return points.reshape(-1, 3)
+
+
+class BlochGrid(VGroup):
+    def __init__(self, num_qubits, columns=None, cell_radius=None, show_labels=True,
+                 sphere_color=BLUE, arrow_color=YELLOW, **kwargs):
+        super().__init__(**kwargs)
+        self.num_qubits = num_qubits
+        columns = columns or math.ceil(math.sqrt(num_qubits))
+        rows = math.ceil(num_qubits / columns)
+        if cell_radius is None:
+            # Fill most of the frame, leaving a spacing of 2.4 radii per cell
+            cell_radius = min(0.9 * config.frame_width / columns, 0.8 * config.frame_height / rows) / 2.4
+        self.cell_radius = cell_radius
+        self.projection = projection_matrix()
+
+        # Cell centres, row by row from the top left, centred on the origin
+        index = np.arange(num_qubits)
+        spacing = 2.4 * cell_radius
+        self.centers = np.zeros((num_qubits, 3))
+        self.centers[:, 0] = (index % columns - (columns - 1) / 2) * spacing
+        self.centers[:, 1] = ((rows - 1) / 2 - index // columns) * spacing
+
+        cell = self._build_cell(sphere_color)
+        self.cells = VGroup(*[cell.copy().move_to(center) for center in self.centers])
+        self.labels = VGroup()
+        if show_labels:
+            self.labels = VGroup(*[
+                CounterText("q{}", q, font_size=max(10, int(40 * cell_radius))).next_to(self.cells[q], DOWN, buff=0.05)
+                for q in range(num_qubits)
+            ])
+        self.arrows = VMobject(stroke_color=arrow_color, stroke_width=max(1, 4 * cell_radius),
+                               fill_color=arrow_color, fill_opacity=1)
+        self.add(self.cells, self.labels, self.arrows)
+        self.set_vectors(np.zeros((num_qubits, 3)))
+
+    def _build_cell(self, sphere_color):
+        """Outline and equator of one projected unit sphere, scaled to a cell"""
+        outline = Circle(radius=self.cell_radius, color=sphere_color, stroke_width=2)
+        outline.set_fill(sphere_color, opacity=0.15)
+        angles = np.linspace(0, TAU, 33)
+        equator_3d = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+        equator_points = np.zeros((len(angles), 3))
+        equator_points[:, :2] = self.cell_radius * equator_3d @ self.projection.T
+        equator = VMobject(stroke_color=sphere_color, stroke_width=1, stroke_opacity=0.6)
+        equator.set_points_smoothly(equator_points)
+        return VGroup(outline, equator)
+
+    def arrow_points(self, vectors):
+        """Points of every arrow (shaft + triangular head) for per-qubit Bloch vectors of shape (n, 3)"""
+        # Follow the grid wherever it has been moved or scaled to, from the first cell alone
+        radius = self.cells[0][0].width / 2
+        factor = radius / self.cell_radius
+        origins = self.cells[0].get_center() + factor * (self.centers - self.centers[0])
+        screen = np.zeros((self.num_qubits, 3))
+        screen[:, :2] = radius * np.asarray(vectors, dtype=float) @ self.projection.T
+        tips = origins + screen
+
+        lengths = np.linalg.norm(screen, axis=1, keepdims=True)
+        directions = np.divide(screen, lengths, out=np.zeros_like(screen), where=lengths > 1e-9)
+        normals = np.stack([-directions[:, 1], directions[:, 0], np.zeros(self.num_qubits)], axis=1)
+        head = np.minimum(0.3 * radius, 0.5 * lengths)
+        bases = tips - head * directions
+        left, right = bases + 0.5 * head * normals, bases - 0.5 * head * normals
+
+        # Per qubit: shaft, then the three edges of the head
+        starts = np.stack([origins, tips, left, right], axis=1).reshape(-1, 3)
+        ends = np.stack([bases, left, right, tips], axis=1).reshape(-1, 3)
+        return _segments(starts, ends)
+
+    def set_vectors(self, vectors):
+        """Points every arrow at once; vectors has shape (n, 3)"""
+        self.arrows.set_points(self.arrow_points(vectors))
+        return self
+
+    def follow(self, frames, tracker):
+        """Keeps the arrows on frames[tracker value] (shape (steps, n, 3)), interpolating between steps"""
+        frames = np.asarray(frames, dtype=float)
+
+        def update(grid):
+            value = min(max(tracker.get_value(), 0), len(frames) - 1)
+            step = min(int(value), len(frames) - 2) if len(frames) > 1 else 0
+            alpha = value - step
+            vectors = frames[step] if len(frames) == 1 else (1 - alpha) * frames[step] + alpha * frames[step + 1]
+            grid.set_vectors(vectors)
+
+        self.add_updater(update)
+        return self
+
+
+def grid_from_circuit(qc, backend="auto", frames_per_step=1, **kwargs):
+    """BlochGrid for qc together with its Bloch vectors, shape (steps * frames_per_step + 1, n, 3), from one simulation pass
+
+    With frames_per_step > 1 single-qubit gates are tracked along the arc they
+    really turn the vector through (see bloch_rotation.py).
+    """
+    frames = trajectory_tracks(get_trajectory(qc, backend), frames_per_step)
+    grid = BlochGrid(qc.num_qubits, **kwargs)
+    grid.set_vectors(frames[0])
+    return grid, frames
+
+
+class BlochGridScene(Scene):
+    def __init__(self, qc=None, **kwargs):
+        super().__init__(**kwargs)
+        if qc is None:
+            # 36 qubits tipped over by different angles, then entangled in pairs
+            qc = QuantumCircuit(36)
+            for q in range(36):
+                qc.ry(PI * (q + 1) / 37, q)
+            for q in range(0, 36, 2):
+                qc.cx(q, q + 1)
+        self.qc = qc
+
+    def construct(self):
+        frames_per_step = 8
+        grid, frames = grid_from_circuit(self.qc, frames_per_step=frames_per_step)
+        time_label = CounterText("t = {}", font_size=28).to_corner(UL)
+        self.play(FadeIn(grid), FadeIn(time_label))
+
+        tracker = ValueTracker(0)
+        grid.follow(frames, tracker)
+        for t in range(1, len(self.qc.data) + 1):
+            time_label.set_value(t)
+            self.play(
+                tracker.animate.set_value(t * frames_per_step),
+                run_time=0.15,
+            )
+        grid.clear_updaters()
+        self.wait(2)
+
+
+if __name__ == "__main__":
+    scene = BlochGridScene()
+    scene.render()
@@ -0,0 +1,73 @@
+import numpy as np
+from epr_example.statevector import X, Y, Z, gate_matrix, NON_UNITARY
+
+# Bloch-sphere rotations derived from gate matrices.
+#
+# Every single-qubit unitary is, up to a global phase, exp(-i theta/2 n.sigma):
+# a rotation of the Bloch sphere by theta about the unit axis n. The helpers
+# here turn stacks of 2x2 unitaries into (axis, angle) pairs and precompute the
+# whole per-frame path of every qubit's arrow in one vectorized Rodrigues
+# formula, so a scene only has to index the result while it plays.
+
+PAULIS = np.stack([X, Y, Z])
+
+
+def axis_angle(unitaries):
+    """SO(3) rotation axis (..., 3) and angle in [0, pi] (...,) of 2x2 unitaries (..., 2, 2)"""
+    u = np.asarray(unitaries, dtype=complex)
+    # Remove the global phase: V = U / sqrt(det U) is in SU(2), then pick the sign with cos(theta/2) >= 0
+    v = u / np.sqrt(np.linalg.det(u))[..., None, None]
+    cos_half = np.trace(v, axis1=-2, axis2=-1).real / 2
+    v = np.where((cos_half < 0)[..., None, None], -v, v)
+    cos_half = np.abs(cos_half)
+    # V = cos(theta/2) I - i sin(theta/2) n.sigma, so Tr(V sigma_k) = -2i sin(theta/2) n_k
+    sin_axis = (0.5j * np.einsum("...ij,kji->...k", v, PAULIS)).real
+    sin_half = np.linalg.norm(sin_axis, axis=-1)
+    angle = 2 * np.arctan2(sin_half, cos_half)
+    axis = np.divide(sin_axis, sin_half[..., None], out=np.zeros_like(sin_axis), where=sin_half[..., None] > 1e-12)
+    axis[sin_half <= 1e-12] = [0, 0, 1]  # identity: any axis will do
+    return axis, angle
+
+
+def rotation_matrices(axis, angles):
+    """3x3 rotations about axis (..., 3) by angles (frames, ...), shape (frames, ..., 3, 3)"""
+    axis = np.asarray(axis, dtype=float)
+    angles = np.asarray(angles, dtype=float)[..., None, None]
+    k = np.zeros(axis.shape[:-1] + (3, 3))
+    k[..., 0, 1], k[..., 0, 2], k[..., 1, 2] = -axis[..., 2], axis[..., 1], -axis[..., 0]
+    k = k - np.swapaxes(k, -1, -2)
+    return np.eye(3) + np.sin(angles) * k + (1 - np.cos(angles)) * (k @ k)
+
+
+def gate_rotation_frames(unitaries, frames):
+    """Per-frame rotation matrices (frames, ..., 3, 3) turning the Bloch sphere from identity to each unitary"""
+    axis, angle = axis_angle(unitaries)
+    progress = np.linspace(0, 1, frames).reshape((frames,) + (1,) * np.ndim(angle))
+    return rotation_matrices(axis, progress * angle)
+
+
+def rotation_tracks(unitaries, vectors, frames):
+    """Per-frame Bloch vectors (frames, n, 3) of qubits with vectors (n, 3) while the unitaries (n, 2, 2) act"""
+    rotations = gate_rotation_frames(unitaries, frames)
+    return np.einsum("fnij,nj->fni", rotations, np.asarray(vectors, dtype=float))
+
+
+def trajectory_tracks(trajectory, frames_per_step=15):
+    """Per-frame Bloch vectors (frames, n, 3) for a whole StateTrajectory.
+
+    Single-qubit gates turn their qubit along the arc the gate really traces;
+    entangling gates, where no such arc exists, move the vectors in a straight
+    line from one step to the next.
+    """
+    vectors = trajectory.bloch_vectors()
+    n = vectors.shape[1]
+    tracks = [vectors[:1]]
+    progress = np.linspace(0, 1, frames_per_step + 1)[1:, None, None]
+    for t, (name, qubits, _, params) in enumerate(trajectory.instructions):
+        if len(qubits) == 1 and name not in NON_UNITARY:
+            unitaries = np.tile(np.eye(2, dtype=complex), (n, 1, 1))
+            unitaries[qubits[0]] = gate_matrix(name, params)
+            tracks.append(rotation_tracks(unitaries, vectors[t], frames_per_step + 1)[1:])
+        else:
+            tracks.append((1 - progress) * vectors[t] + progress * vectors[t + 1])
+    return np.concatenate(tracks)
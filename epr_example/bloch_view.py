@@ -0,0 +1,137 @@
+from manim import *
+from epr_example.tex_cache import Tex
+import numpy as np
+from epr_example.sphere_mesh import cached_sphere, lod_resolution
+
+# Reusable Bloch sphere component.
+#
+# The static part of a Bloch sphere (the Sphere surface, three Arrow3D axes and
+# the ket labels, whose Tex has to be compiled) is built once per (style,
+# sphere colour, mesh resolution) and every BlochSphereView starts from a copy
+# of it; only the state arrow is built per state. Submobjects are always
+# (sphere, axes, labels, arrow), the layout the scenes' get_bloch_sphere used.
+# The sphere mesh is tessellated for the view's on-screen size (see
+# sphere_mesh.py), so pass screen_radius when the view will be shrunk.
+
+
+def _ket_labels(axes, rotation):
+    """|0>, |1>, |+>, |->, |+i>, |-i> just past the ends of the axes, turned to face the 3D camera"""
+    x_axis, y_axis, z_axis = axes
+
+    def state_label(tex_str, pos):
+        return Tex(tex_str, color=WHITE).move_to(pos).rotate(PI / 2, axis=RIGHT).rotate(rotation, axis=OUT)
+
+    return VGroup(
+        state_label(r"$\left|0\right\rangle$", z_axis.get_end() + 0.3 * OUT),
+        state_label(r"$\left|1\right\rangle$", z_axis.get_start() + 0.3 * IN),
+        state_label(r"$\left|+\right\rangle$", x_axis.get_end() + 0.3 * RIGHT),
+        state_label(r"$\left|-\right\rangle$", x_axis.get_start() + 0.3 * LEFT),
+        state_label(r"$\left|+i\right\rangle$", y_axis.get_end() + 0.3 * UP),
+        state_label(r"$\left|-i\right\rangle$", y_axis.get_start() + 0.3 * DOWN),
+    )
+
+
+def _axis_arrows(colors, length=1.5):
+    return VGroup(*[
+        Arrow3D(start=-length * direction, end=length * direction, color=color)
+        for direction, color in zip([RIGHT, UP, OUT], colors)
+    ])
+
+
+def _default_frame(sphere_color, resolution):
+    """Coloured translucent sphere, white axes, kets (quantum_reps / new_quantum / two_bloch)"""
+    sphere = cached_sphere(1, resolution)
+    sphere.set_fill(color=sphere_color, opacity=0.5)
+    sphere.set_stroke(color=sphere_color, opacity=0.6)
+    axes = _axis_arrows([WHITE, WHITE, WHITE])
+    return sphere, axes, _ket_labels(axes, PI - PI / 6)
+
+
+def _rgb_frame(sphere_color, resolution):
+    """Axes coloured X = green, Y = red, Z = blue (bloch_sphere.py); the sphere keeps manim's checkerboard fill"""
+    sphere = cached_sphere(1, resolution).set_opacity(0.5)
+    axes = _axis_arrows([GREEN, RED, BLUE])
+    return sphere, axes, _ket_labels(axes, PI / 2)
+
+
+def _xyz_frame(sphere_color, resolution):
+    """Axes labelled X, Y, Z instead of kets (old/manim_3d_graph.py); checkerboard sphere as in _rgb_frame"""
+    sphere = cached_sphere(1, resolution).set_opacity(0.5)
+    axes = _axis_arrows([RED, GREEN, WHITE])
+    labels = VGroup(
+        Tex("X").next_to(axes[0].get_end(), RIGHT),
+        Tex("Y").next_to(axes[1].get_end(), UP),
+        Tex("Z").next_to(axes[2].get_end(), OUT),
+    )
+    return sphere, axes, labels
+
+
+def _plain_frame(sphere_color, resolution):
+    """Faint wireframe sphere inside a ThreeDAxes, no labels (test.py)"""
+    sphere = cached_sphere(1.5, resolution).set_fill(opacity=0.1).set_stroke(color=sphere_color)
+    axes = ThreeDAxes(x_range=[-1.8, 1.8], y_range=[-1.8, 1.8], z_range=[-1.8, 1.8], stroke_color=GRAY)
+    return sphere, axes, VGroup()
+
+
+# radius: sphere radius before scaling, i.e. the length of a unit Bloch vector
+# resolution: sphere grid at full size (None: manim's default), as the scenes drew it before
+BLOCH_STYLES = {
+    "default": {"build": _default_frame, "radius": 1, "scale": 1.2, "resolution": None, "arrow_color": RED},
+    "rgb": {"build": _rgb_frame, "radius": 1, "scale": 1.2, "resolution": None, "arrow_color": YELLOW},
+    "xyz": {"build": _xyz_frame, "radius": 1, "scale": 1, "resolution": None, "arrow_color": YELLOW},
+    "plain": {"build": _plain_frame, "radius": 1.5, "scale": 1, "resolution": (30, 30), "arrow_color": RED},
+}
+
+_PROTOTYPES = {}
+
+
+def _prototype(style, sphere_color, resolution):
+    key = (style, str(sphere_color), resolution)
+    if key not in _PROTOTYPES:
+        _PROTOTYPES[key] = VGroup(*BLOCH_STYLES[style]["build"](sphere_color, resolution))
+    return _PROTOTYPES[key]
+
+
+def clear_bloch_cache():
+    _PROTOTYPES.clear()
+
+
+class BlochSphereView(VGroup):
+    def __init__(self, state_vector_endpoint=(0, 0, 1.5), sphere_color=BLUE, style="default", arrow_color=None,
+                 screen_radius=None, resolution=None, **kwargs):
+        super().__init__(**kwargs)
+        self.style = BLOCH_STYLES[style]
+        self.arrow_color = self.style["arrow_color"] if arrow_color is None else arrow_color
+        if resolution is None:
+            # Full detail at the size it is built; less only if it will be shrunk into an inset
+            full_radius = self.style["radius"] * self.style["scale"]
+            resolution = lod_resolution(full_radius if screen_radius is None else screen_radius, full_radius,
+                                        self.style["resolution"])
+        self.resolution = resolution
+        self.sphere, self.axes, self.labels = [part.copy() for part in _prototype(style, sphere_color, resolution)]
+        self.arrow = self._build_arrow(state_vector_endpoint)
+        self.add(self.sphere, self.axes, self.labels, self.arrow)
+        self.scale(self.style["scale"])
+
+    def _build_arrow(self, endpoint):
+        """State arrow in unscaled coordinates (centre at the origin), for a Bloch vector in sphere units"""
+        if endpoint is None:
+            return VGroup()
+        endpoint = np.array(endpoint, dtype=float) * self.style["radius"]
+        if np.linalg.norm(endpoint) <= 1e-6:
+            return VGroup()  # a maximally mixed qubit has no arrow to draw
+        return Arrow3D(start=ORIGIN, end=endpoint, color=self.arrow_color)
+
+    @property
+    def unit(self):
+        """Current on-screen length of a unit Bloch vector"""
+        return self.sphere.width / 2
+
+    def set_state(self, state_vector_endpoint):
+        """Replaces only the state arrow, wherever the sphere has been moved or scaled to"""
+        factor = self.unit / self.style["radius"]
+        arrow = self._build_arrow(state_vector_endpoint).scale(factor, about_point=ORIGIN).shift(self.sphere.get_center())
+        self.remove(self.arrow)
+        self.arrow = arrow
+        self.add(arrow)
+        return self
@@ -1,10 +1,17 @@
 # this is going to end up being the main driver code for the program
 from manim import *
+from epr_example.tex_cache import Tex, PrecompiledTexScene
 from qiskit import QuantumCircuit
 import numpy as np
+from epr_example.sampling import sample_circuit, measured_bits
+from epr_example.measurement_histogram import histogram_from_samples
+from epr_example.gate_glyphs import GATE_GLYPHS
+from epr_example.circuit_layout import CircuitLayout
+from epr_example.circuit_wires import WireSet
+from epr_example.circuit_scroll import ScrollingCircuitView
     
-class Circuit(Scene):
-    def __init__(self, qc=None, **kwargs):
+class Circuit(PrecompiledTexScene, Scene):
+    def __init__(self, qc=None, shots=100_000, batched=True, scroll=False, fold_idle=0, **kwargs):
         super().__init__(**kwargs)
         if qc is None:
             qc = QuantumCircuit(2,2)
@@ -13,23 +20,127 @@ class Circuit(Scene):
         self.qc = qc
         self.num_qubits = qc.num_qubits
         self.num_clbits = qc.num_clbits
+        self.shots = shots
+        self.batched = batched  # one play (one partial movie file) per time step instead of one per animation
+        self.scroll = scroll  # scroll one long strip instead of paging; only the visible columns are built
+        self.fold_idle = fold_idle  # fold runs of at least this many idle qubits into one row (0: never)
+
+        # Gate matrices render on first lookup and are shared with every other scene
+        self.gates_dict = GATE_GLYPHS
+
+    def play_step(self, animations):
+        """Plays one time step's animations in order, as a single Succession when batched"""
+        if self.batched:
+            self.play(Succession(*animations))
+        else:
+            for animation in animations:
+                self.play(animation)
+
+    def gate_group(self, layout, i, shot_bits):
+        """Mobjects of instruction i at its place in the layout (None for barriers)"""
+        instruction = self.qc.data[i]
+        gate = instruction.operation
+        q_indices = layout.qubit_rows[i]
+        c_indices = [self.qc.find_bit(c).index for c in instruction.clbits]
+        x, scale = layout.x[i], layout.gate_scale
+
+        if gate.name in ["cx", "ccx"]:
+            ctrl_dot = Dot().scale(scale).move_to(np.array([x, layout.qubit_y[q_indices[0]], 0]))
+            tgt_circle = Circle().scale(0.3 * scale).move_to(np.array([x, layout.qubit_y[q_indices[-1]], 0]))
+            ctrl_line = Line(ctrl_dot.get_center(), tgt_circle.get_center())
+            return VGroup(ctrl_dot, tgt_circle, ctrl_line)
+
+        if gate.name == "measure":
+            y_q, y_c = layout.qubit_y[q_indices[0]], layout.clbit_y
+            measure_box = Square().scale(0.5 * scale).move_to(np.array([x, y_q, 0]))
+            measure_label = Tex(r"\textbf{M}").scale(0.7 * scale).move_to(measure_box)
+            arrow = Arrow(measure_box.get_bottom(), measure_box.get_bottom() + DOWN * 0.5, buff=0.1, color=WHITE, stroke_width=2)
+            collapse_line = Line(measure_box.get_bottom(), np.array([x, y_c, 0]), color=WHITE, stroke_width=2)
+            measure_group = VGroup(measure_box, measure_label, arrow, collapse_line)
+            if c_indices[0] in shot_bits:
+                outcome = Tex(shot_bits[c_indices[0]]).scale(0.6 * scale).next_to(np.array([x, y_c, 0]), DOWN, buff=0.15)
+                measure_group.add(outcome)
+            return measure_group
+
+        if gate.num_qubits == 1 and gate.name != "barrier":
+            gate_box = Square().scale(0.5 * scale).move_to(np.array([x, layout.qubit_y[q_indices[0]], 0]))
+            gate_label = Tex(gate.name.upper()).scale(scale).move_to(gate_box)
+            return VGroup(gate_box, gate_label)
+        return None
+
+    def wire_rows(self, layout, page):
+        """Heights, [x0, x1] pieces, dashed and dimmed flags of the display rows' wires and the classical wire of a page"""
+        qubit_intervals, classical_intervals = layout.wire_intervals(page)
+        has_classical = self.num_clbits > 0
+        rows = list(layout.display_y) + ([layout.clbit_y] if has_classical else [])
+        pieces = qubit_intervals + ([classical_intervals] if has_classical else [])
+        dashed = [False] * layout.num_rows + [True] * has_classical
+        dimmed = list(layout.row_folded) + [False] * has_classical  # bundles of idle qubits recede
+        return rows, pieces, dashed, dimmed
+
+    def gate_key(self, layout, i, shot_bits):
+        """What instruction i's mobjects look like apart from their x: gate, rows and shown outcome"""
+        instruction = self.qc.data[i]
+        bits = tuple(shot_bits.get(self.qc.find_bit(c).index) for c in instruction.clbits)
+        return instruction.operation.name, tuple(layout.qubit_rows[i]), bits
+
+    def draw_pages(self, layout, shot_bits, t_label):
+        """Draws the circuit column by column, a frame-wide page at a time; returns what is left on screen"""
+        # Gates and wires of the page on screen
+        page_mobjects = VGroup()
+
+        # For each layout column
+        for column in range(layout.num_layers):
+            page = layout.column_page[column]
+            if column == 0 or page != layout.column_page[column - 1]:
+                if column:
+                    # Next page: clear the finished columns, keep the labels
+                    self.play(FadeOut(page_mobjects), run_time=0.5)
+                # One path per wire for the whole page, cut where its gates sit, grown column by column
+                wires = WireSet(*self.wire_rows(layout, page))
+                page_mobjects = VGroup(wires)
+                self.add(wires)
+
+            gates = [self.gate_group(layout, i, shot_bits) for i in layout.instructions_in(column)]
+            gates = [gate_group for gate_group in gates if gate_group is not None]
+            step = []
+            if gates:
+                step.append(AnimationGroup(*[FadeIn(gate_group) for gate_group in gates], run_time=0.5))
+
+            # Every wire across the column at once
+            step.append(wires.grow(layout.column_x[column] + layout.column_width / 2, run_time=0.2))
+            page_mobjects.add(*gates)
 
-        self.gates_dict = {
-            "id": MathTex(r"I = \begin{bmatrix} 1 & 0 \\ 0 & 1 \end{bmatrix}"),  # Identity Gate
-            "x": MathTex(r"X = \begin{bmatrix} 0 & 1 \\ 1 & 0 \end{bmatrix}"),  # Pauli-X Gate
-            "y": MathTex(r"Y = \begin{bmatrix} 0 & -i \\ i & 0 \end{bmatrix}"),  # Pauli-Y Gate
-            "z": MathTex(r"Z = \begin{bmatrix} 1 & 0 \\ 0 & -1 \end{bmatrix}"),  # Pauli-Z Gate
-            "h": MathTex(r"H = \frac{1}{\sqrt{2}} \begin{bmatrix} 1 & 1 \\ 1 & -1 \end{bmatrix}"),  # Hadamard Gate
-            "cx": MathTex(r"\text{CNOT} = \begin{bmatrix} 1 & 0 & 0 & 0 \\ 0 & 1 & 0 & 0 \\ 0 & 0 & 0 & 1 \\ 0 & 0 & 1 & 0 \end{bmatrix}")  # CNOT Gate
-        }
+            # Update time label
+            new_time_label = Tex(f"t={column + 1}").to_edge(UP)
+            step.append(Transform(t_label, new_time_label, run_time=0.3))
+            self.play_step(step)
+
+        return page_mobjects
+
+    def draw_scrolling(self, layout, shot_bits, t_label):
+        """Draws the circuit as one strip that scrolls left to follow the column being drawn"""
+        view = ScrollingCircuitView(layout, lambda i: self.gate_group(layout, i, shot_bits),
+                                    lambda i: self.gate_key(layout, i, shot_bits), *self.wire_rows(layout, 0))
+        self.add(view)
+        for column in range(layout.num_layers):
+            step = [
+                view.scroll(column, run_time=0.3),
+                view.reveal(column, run_time=0.5),
+                view.wires.grow(layout.column_x[column] + layout.column_width / 2, run_time=0.2),
+                Transform(t_label, Tex(f"t={column + 1}").to_edge(UP), run_time=0.3),
+            ]
+            self.play_step([animation for animation in step if animation is not None])
+
+        return view
 
     def construct(self):
         print(self.qc.draw(output='text'))  # Debug print
 
-        circuit_shift = UP * 1.5
-        width = 1.0  # consistent width for each segment
-        total_timesteps = len(self.qc.data)
-        
+        # Gates on disjoint qubits share a column; columns shrink (then paginate or scroll) to fit the frame
+        # Rows squeeze to fit the register, and with fold_idle runs of idle qubits share one bundle row
+        layout = CircuitLayout(self.qc, paginate=not self.scroll, fold_idle=self.fold_idle)
+
         # Time axis
         t_axis = Line(LEFT * 6, RIGHT * 6, color=YELLOW).to_edge(DOWN, buff=1)
         t_label = Tex("t").next_to(t_axis, DOWN)
@@ -37,87 +148,44 @@ class Circuit(Scene):
         self.wait(1)
 
         # Qubit & classical labels
-        qubit_labels = VGroup(*[Tex(f"$q_{i}$").to_edge(LEFT).shift(DOWN * i + circuit_shift) for i in range(self.num_qubits)])
-        classical_label = Tex("$c$").to_edge(LEFT).shift(DOWN * self.num_qubits + circuit_shift)
+        qubit_labels = VGroup(*[
+            Tex(f"$q_{{{first}}} \\ldots q_{{{last}}}$" if last > first else f"$q_{{{first}}}$").scale(layout.gate_scale)
+            .to_edge(LEFT).set_y(y)
+            for (first, last), y in zip(layout.row_qubits, layout.display_y)
+        ])
+        classical_label = Tex("$c$").scale(layout.gate_scale).to_edge(LEFT).set_y(layout.clbit_y)
         self.play(Write(qubit_labels), Write(classical_label))
         self.wait(1)
 
-        # Store per-qubit line segments
-        qubit_line_segments = [[] for _ in range(self.num_qubits)]
-        classical_segments = []
-
-        # For each time step
-        for t in range(total_timesteps):
-            x_pos = LEFT * 6 + RIGHT * (t * width + width / 2)  # center of segment
-
-            instruction = self.qc.data[t]
-            gate, qubits, clbits = instruction.operation, instruction.qubits, instruction.clbits
-            q_indices = [self.qc.find_bit(q).index for q in qubits]
-            c_indices = [self.qc.find_bit(c).index for c in clbits] if clbits else []
-
-            gate_group = None
-
-            # Prepare gate visuals
-            if gate.name in ["cx", "ccx"]:
-                ctrl_dot = Dot().move_to(np.array([x_pos[0], qubit_labels[q_indices[0]].get_center()[1], 0]))
-                tgt_circle = Circle().scale(0.3).move_to(np.array([x_pos[0], qubit_labels[q_indices[1]].get_center()[1], 0]))
-                ctrl_line = Line(ctrl_dot.get_center(), tgt_circle.get_center())
-                gate_group = VGroup(ctrl_dot, tgt_circle, ctrl_line)
-
-            elif gate.name == "measure":
-                y_q = qubit_labels[q_indices[0]].get_center()[1]
-                y_c = classical_label.get_center()[1]
-                measure_box = Square().scale(0.5).move_to(np.array([x_pos[0], y_q, 0]))
-                measure_label = Tex(r"\textbf{M}").scale(0.7).move_to(measure_box)
-                arrow = Arrow(measure_box.get_bottom(), measure_box.get_bottom() + DOWN * 0.5, buff=0.1, color=WHITE, stroke_width=2)
-                collapse_line = Line(measure_box.get_bottom(), np.array([x_pos[0], y_c, 0]), color=WHITE, stroke_width=2)
-                gate_group = VGroup(measure_box, measure_label, arrow, collapse_line)
-
-            elif gate.num_qubits == 1:
-                y_q = qubit_labels[q_indices[0]].get_center()[1]
-                gate_box = Square().scale(0.5).move_to(np.array([x_pos[0], y_q, 0]))
-                gate_label = Tex(gate.name.upper()).move_to(gate_box)
-                gate_group = VGroup(gate_box, gate_label)
-
-            if gate_group:
-                self.play(FadeIn(gate_group), run_time=0.5)
-
-            # For each qubit, draw segment
-            for q in range(self.num_qubits):
-                y = qubit_labels[q].get_center()[1]
-                segment_start = x_pos[0] - width / 2
-                segment_end = x_pos[0] + width / 2
-
-                if q in q_indices:
-                    # split into two small segments before/after gate
-                    left = Line([segment_start, y, 0], [x_pos[0] - 0.2, y, 0], color=WHITE)
-                    right = Line([x_pos[0] + 0.2, y, 0], [segment_end, y, 0], color=WHITE)
-                    self.play(Create(left), Create(right), run_time=0.2)
-                    qubit_line_segments[q].extend([left, right])
-                else:
-                    segment = Line([segment_start, y, 0], [segment_end, y, 0], color=WHITE)
-                    self.play(Create(segment), run_time=0.2)
-                    qubit_line_segments[q].append(segment)
-
-            # For classical bit line
-            if self.num_clbits > 0:
-                y = classical_label.get_center()[1]
-                segment = DashedLine(
-                    [x_pos[0] - width / 2, y, 0],
-                    [x_pos[0] + width / 2, y, 0],
-                    color=GRAY
-                )
-                self.play(Create(segment), run_time=0.2)
-                classical_segments.append(segment)
-
-            # Update time label
-            new_time_label = Tex(f"t={t + 1}").to_edge(UP)
-            self.play(Transform(t_label, new_time_label), run_time=0.3)
+        # Sample the measurements up front; the first shot is the one the measure boxes show
+        shot_bits = {}
+        if any(instruction.operation.name == "measure" for instruction in self.qc.data):
+            try:
+                outcome_labels, outcomes = sample_circuit(self.qc, self.shots)
+            except ValueError as error:
+                # Gates the simulators don't know are still drawn, just without outcomes or histogram
+                print(f"Skipping the measurement histogram: {error}")
+            else:
+                first_shot = outcome_labels[outcomes[0]]
+                shot_bits = {clbit: bit for (_, clbit), bit in zip(measured_bits(self.qc), first_shot)}
+
+        if self.scroll:
+            on_screen = self.draw_scrolling(layout, shot_bits, t_label)
+        else:
+            on_screen = self.draw_pages(layout, shot_bits, t_label)
 
         self.wait(2)
-        self.play(FadeOut(*qubit_labels, classical_label, t_axis, t_label, *[seg for row in qubit_line_segments for seg in row], *classical_segments))
+        self.play(FadeOut(*qubit_labels, classical_label, t_axis, t_label, on_screen))
         self.wait(1)
 
+        # Measurement statistics over all the sampled shots
+        if shot_bits:
+            histogram = histogram_from_samples(outcome_labels, outcomes)
+            self.play(FadeIn(histogram))
+            self.play(histogram.grow())
+            self.wait(2)
+            self.play(FadeOut(histogram))
+
 
 if __name__ == "__main__":
     scene = Circuit()
@@ -0,0 +1,138 @@
+import numpy as np
+import math
+
+# Layered layout for circuit diagrams.
+#
+# Instructions are scheduled ASAP: each goes in the first column after the
+# last one used by any wire it touches, so gates on disjoint qubits share a
+# column instead of queueing one per time step. A gate that spans rows (the
+# control-target line of a CX, the drop from a measure to the classical wire)
+# claims every row it crosses, so nothing is drawn through it. Barriers take
+# no column; they only line the frontier of their qubits up.
+#
+# Everything the scene needs to place (column x, row y, gate page, the wire
+# pieces between gates) comes out as NumPy arrays from one pass. Columns
+# shrink to fit the frame down to min_scale; past that the circuit is split
+# into pages of whole columns, or left as one long strip for a view that
+# scrolls (circuit_scroll.py).
+#
+# Rows squeeze together to fit the register between top and bottom, and with
+# fold_idle runs of that many qubits that no gate touches share one bundle
+# row, so a wide register's idle qubits cost one wire instead of one each.
+
+GATE_GAP = 0.2  # half-width of the gap a gate leaves in its wire, before scaling
+
+
+def instruction_rows(qc):
+    """(rows touched, rows crossed) per instruction, rows being the qubits then one shared classical row"""
+    num_qubits = qc.num_qubits
+    touched, crossed = [], []
+    for instruction in qc.data:
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        rows = list(qubits)
+        if instruction.clbits:
+            rows.append(num_qubits)  # every clbit is drawn on the single classical wire
+        touched.append(qubits)
+        crossed.append(list(range(min(rows), max(rows) + 1)) if rows else [])
+    return touched, crossed
+
+
+def asap_layers(qc):
+    """Column of every instruction (barriers get the column they line up to) and the number of columns"""
+    _, crossed = instruction_rows(qc)
+    frontier = np.zeros(qc.num_qubits + 1, dtype=int)  # first free column per row
+    layers = np.zeros(len(qc.data), dtype=int)
+    for i, (instruction, rows) in enumerate(zip(qc.data, crossed)):
+        if not rows:
+            continue
+        column = frontier[rows].max()
+        if instruction.operation.name == "barrier":
+            frontier[rows] = column
+            layers[i] = max(column - 1, 0)
+            continue
+        layers[i] = column
+        frontier[rows] = column + 1
+    return layers, int(frontier.max())
+
+
+class CircuitLayout:
+    def __init__(self, qc, left=-6.0, right=6.0, top=1.5, bottom=-2.5, column_width=1.0, row_height=1.0,
+                 min_scale=0.5, paginate=True, fold_idle=0):
+        self.qc = qc
+        self.num_qubits = qc.num_qubits
+        self.names = [instruction.operation.name for instruction in qc.data]
+        self.drawn = np.array([name != "barrier" for name in self.names], dtype=bool)
+        self.qubit_rows, self.crossed_rows = instruction_rows(qc)
+        self.layers, self.num_layers = asap_layers(qc)
+
+        # Shrink the columns to fit the frame, then paginate whatever still doesn't
+        available = right - left
+        natural = max(self.num_layers, 1) * column_width
+        self.scale = min(1.0, max(available / natural, min_scale))
+        self.column_width = column_width * self.scale
+        self.columns_on_screen = max(1, int(math.floor(available / self.column_width + 1e-9)))
+        # Without pagination the columns run on past `right` as one long strip, for a scrolling view
+        self.columns_per_page = self.columns_on_screen if paginate else max(self.num_layers, 1)
+        self.num_pages = max(1, math.ceil(self.num_layers / self.columns_per_page))
+
+        columns = np.arange(self.num_layers)
+        self.column_page = columns // self.columns_per_page
+        self.column_x = left + (columns % self.columns_per_page + 0.5) * self.column_width
+        self.page = self.column_page[self.layers] if self.num_layers else np.zeros(len(self.layers), dtype=int)
+        self.x = self.column_x[self.layers] if self.num_layers else np.zeros(len(self.layers))
+
+        # occupied[column, qubit]: the qubit's wire has a gate on it in that column
+        self.occupied = np.zeros((self.num_layers, self.num_qubits), dtype=bool)
+        for i in np.flatnonzero(self.drawn):
+            self.occupied[self.layers[i], self.qubit_rows[i]] = True
+        self.activity = self.occupied.sum(axis=0)  # gates per qubit
+
+        # Display rows: one per qubit, except that runs of at least fold_idle idle qubits share one bundle row
+        idle = self.activity == 0
+        run = np.concatenate([[0], np.cumsum(idle[1:] != idle[:-1])]) if self.num_qubits else np.zeros(0, dtype=int)
+        folded = idle & (np.bincount(run)[run] >= fold_idle) if fold_idle else np.zeros(self.num_qubits, dtype=bool)
+        starts_row = ~(folded & np.concatenate([[False], folded[:-1]]))
+        self.qubit_row = np.cumsum(starts_row) - 1  # display row of every qubit
+        self.num_rows = int(starts_row.sum())
+        first = np.flatnonzero(starts_row)
+        self.row_qubits = np.stack([first, np.concatenate([first[1:] - 1, [self.num_qubits - 1]])], axis=1) \
+            if self.num_rows else np.zeros((0, 2), dtype=int)  # first and last qubit of every display row
+        self.row_folded = self.row_qubits[:, 1] > self.row_qubits[:, 0]
+
+        # Rows (and the classical row below them) squeeze together to fit between top and bottom
+        self.row_height = min(row_height, (top - bottom) / max(self.num_rows, 1))
+        self.gate_scale = min(self.scale, self.row_height / row_height)  # gates shrink with the tighter of the two
+        self.row_y = top - self.row_height * np.arange(self.num_rows + 1)
+        self.display_y = self.row_y[:-1]
+        self.qubit_y = self.display_y[self.qubit_row]
+        self.clbit_y = self.row_y[-1]
+
+    def columns(self, page=None):
+        """Column indices, of one page or all of them"""
+        columns = np.arange(self.num_layers)
+        return columns if page is None else columns[self.column_page == page]
+
+    def instructions_in(self, column):
+        """Indices of the drawn instructions in a column, in circuit order"""
+        return np.flatnonzero(self.drawn & (self.layers == column))
+
+    def wire_intervals(self, page=0):
+        """[x0, x1] pieces, shape (k, 2), of every display row's wire across a page, cut where gates sit, and of the classical wire"""
+        columns = self.columns(page)
+        if not len(columns):
+            return [np.zeros((0, 2)) for _ in range(self.num_rows)], np.zeros((0, 2))
+        half, gap = self.column_width / 2, GATE_GAP * self.gate_scale
+        x0, x1 = self.column_x[columns[0]] - half, self.column_x[columns[-1]] + half
+        # A row has a gate in a column when any of its qubits does (only unfolded rows ever do)
+        row_occupied = self.occupied[columns].astype(int) @ (self.qubit_row[:, None] == np.arange(self.num_rows)) > 0
+        row_intervals = [gap_intervals(x0, x1, self.column_x[columns][row_occupied[:, r]], gap)
+                         for r in range(self.num_rows)]
+        return row_intervals, np.array([[x0, x1]])
+
+
+def gap_intervals(x0, x1, gap_centers, half_gap):
+    """Pieces [start, end] of a wire from x0 to x1 with a gap of 2 * half_gap around each centre"""
+    centers = np.sort(np.asarray(gap_centers, dtype=float))
+    starts = np.concatenate([[x0], centers + half_gap])
+    ends = np.concatenate([centers - half_gap, [x1]])
+    return np.stack([starts, ends], axis=1)
@@ -0,0 +1,101 @@
+from manim import *
+import numpy as np
+from collections import defaultdict
+from epr_example.circuit_wires import WireSet
+
+# Scrolling circuit view for circuits far wider than the frame.
+#
+# The layout is one long strip of columns (CircuitLayout(paginate=False)) and
+# the view scrolls left to keep the column being drawn on screen. Only the
+# columns inside the window exist as mobjects: a column's gates are built
+# when it is revealed and handed back to a pool when they scroll off the
+# left edge. The pool is keyed by what the gate looks like, so a later
+# identical gate reuses those mobjects with a single move. The wires stay as
+# interval data and only their visible slice becomes points. Memory and
+# per-frame work depend on the window, not on the circuit's depth.
+
+
+class ScrollingCircuitView(VGroup):
+    def __init__(self, layout, build, key, rows, pieces, dashed, dimmed=None, left=-6.0, right=6.0):
+        """build(i) makes instruction i's mobjects at its strip position, key(i) says which ones look alike"""
+        super().__init__()
+        self.layout = layout
+        self.build = build
+        self.key = key
+        self.left, self.right = left, right
+        self.offset = 0.0
+        self.wires = WireSet(rows, pieces, dashed=dashed, dimmed=dimmed).scroll_to(0.0, left)
+        self.gates = VGroup()
+        self.columns_shown = {}  # column -> [(key, mobject), ...] currently on screen
+        self.pool = defaultdict(list)
+        self.add(self.wires, self.gates)
+        # Offset that puts each column's right edge on screen; it never goes backwards
+        edges = layout.column_x + layout.column_width / 2
+        self.offsets = np.maximum.accumulate(np.maximum(edges - right, 0.0)) if len(edges) else edges
+
+    def _take(self, i, x):
+        """Mobjects for instruction i centred on screen x, from the pool when an identical gate scrolled off"""
+        key = self.key(i)
+        if self.pool[key]:
+            return key, self.pool[key].pop().set_x(x)
+        mob = self.build(i)
+        return key, mob.shift((x - self.layout.x[i]) * RIGHT) if mob is not None else None
+
+    def column_mobjects(self, column):
+        """The column's gates, placed for the offset it will be drawn at"""
+        x = self.layout.column_x[column] - self.offsets[column]
+        taken = [self._take(i, x) for i in self.layout.instructions_in(column)]
+        taken = [(key, mob) for key, mob in taken if mob is not None]
+        self.columns_shown[column] = taken
+        return VGroup(*[mob for _, mob in taken])
+
+    def set_offset(self, offset):
+        """Scrolls to offset, recycling the columns that have left the window"""
+        self.gates.shift((self.offset - offset) * RIGHT)
+        self.offset = offset
+        self.wires.scroll_to(offset, self.left)
+        half = self.layout.column_width / 2
+        for column in [c for c in self.columns_shown if self.layout.column_x[c] + half - offset <= self.left]:
+            for key, mob in self.columns_shown.pop(column):
+                self.gates.remove(mob)
+                self.pool[key].append(mob)
+        return self
+
+    def reveal(self, column, **kwargs):
+        """Fade-in of a column's gates, or None for an empty column"""
+        mobjects = self.column_mobjects(column)
+        return RevealGates(self, mobjects, **kwargs) if len(mobjects) else None
+
+    def scroll(self, column, **kwargs):
+        """Scroll that brings a column on screen, or None when it already is"""
+        return ScrollCircuit(self, self.offsets[column], **kwargs) if self.offsets[column] > self.offset_after(column) else None
+
+    def offset_after(self, column):
+        """Offset once every column before this one has been drawn"""
+        return self.offsets[column - 1] if column else 0.0
+
+
+class RevealGates(FadeIn):
+    def __init__(self, view, mobjects, **kwargs):
+        self.view = view
+        super().__init__(mobjects, **kwargs)
+
+    def _setup_scene(self, scene):
+        # On screen through the view rather than the scene, so later scrolls carry it along
+        self.view.gates.add(*self.mobject)
+
+
+class ScrollCircuit(Animation):
+    def __init__(self, view, offset, **kwargs):
+        self.offset = offset
+        super().__init__(view, **kwargs)
+
+    def begin(self):
+        self.start = self.mobject.offset
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()  # the view redraws from its own data, no need to copy it
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_offset(self.start + self.rate_func(alpha) * (self.offset - self.start))
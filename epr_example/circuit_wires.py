@@ -0,0 +1,97 @@
+from manim import *
+import numpy as np
+
+# Circuit wires as one path per row.
+#
+# Drawing a wire as a Line per time step (two around each gate) costs
+# qubits x depth mobjects and as many Create animations. Here each wire is a
+# single VMobject whose pieces between gates are disconnected subpaths, and a
+# dashed classical wire is the same thing cut into dashes. Growing the circuit
+# only moves the x the wires are drawn up to, so a whole register extends
+# with one animation and the mobject count is one per row.
+
+DASH_LENGTH = 0.1
+
+
+def _segments(starts, ends):
+    """Cubic Bezier control points of straight segments, shape (k * 4, 3)"""
+    thirds = np.array([0, 1, 2, 3])[None, :, None] / 3
+    points = starts[:, None, :] + thirds * (ends - starts)[:, None, :]
+    return points.reshape(-1, 3)
+
+
+def dash_intervals(intervals, dash_length=DASH_LENGTH, ratio=0.5):
+    """Intervals (k, 2) cut into dashes of dash_length, ratio of each dash period drawn"""
+    intervals = np.asarray(intervals, dtype=float).reshape(-1, 2)
+    period = dash_length / ratio
+    counts = np.ceil((intervals[:, 1] - intervals[:, 0]) / period).astype(int).clip(min=0)
+    owner = np.repeat(np.arange(len(intervals)), counts)
+    index = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts = intervals[owner, 0] + index * period
+    ends = np.minimum(starts + dash_length, intervals[owner, 1])
+    return np.stack([starts, ends], axis=1)
+
+
+class WireSet(VGroup):
+    def __init__(self, ys, intervals, dashed=None, dimmed=None, color=WHITE, dashed_color=GRAY,
+                 stroke_width=DEFAULT_STROKE_WIDTH):
+        """One wire per row at height ys[i] made of the [x0, x1] pieces intervals[i]; dashed[i] draws it dashed, dimmed[i] faint"""
+        super().__init__()
+        dashed = [False] * len(ys) if dashed is None else dashed
+        dimmed = [False] * len(ys) if dimmed is None else dimmed
+        self.ys = np.asarray(ys, dtype=float)
+        intervals = [np.asarray(pieces, dtype=float).reshape(-1, 2) for pieces in intervals]
+        intervals = [pieces[pieces[:, 1] > pieces[:, 0]] for pieces in intervals]  # gates can swallow a whole piece
+        self.intervals = [dash_intervals(pieces) if dash else pieces for pieces, dash in zip(intervals, dashed)]
+        self.wires = [VMobject(stroke_color=dashed_color if dash else color, stroke_width=stroke_width,
+                               stroke_opacity=0.4 if dim else 1.0) for dash, dim in zip(dashed, dimmed)]
+        self.add(*self.wires)
+        # Scrolling: wire x minus offset is the screen x, and nothing left of window_left is drawn
+        self.offset = 0.0
+        self.window_left = -np.inf
+        starts = [pieces[0, 0] for pieces in self.intervals if len(pieces)]
+        self.extent = min(starts) if starts else 0.0
+        self.set_extent(self.extent)
+
+    def set_extent(self, x):
+        """Draws every wire from its start (or the window's left edge) up to x"""
+        self.extent = x
+        left = self.window_left + self.offset
+        for wire, y, pieces in zip(self.wires, self.ys, self.intervals):
+            # Pieces are in order, so the visible ones are a slice found by bisection, however long the wire
+            first = np.searchsorted(pieces[:, 1], left, side="right")
+            last = np.searchsorted(pieces[:, 0], x, side="left")
+            shown = pieces[first:max(first, last)]
+            points = np.zeros((len(shown), 2, 3))
+            points[:, 0, 0] = np.maximum(shown[:, 0], left) - self.offset
+            points[:, 1, 0] = np.minimum(shown[:, 1], x) - self.offset
+            points[:, :, 1] = y
+            wire.set_points(_segments(points[:, 0], points[:, 1]))
+        return self
+
+    def scroll_to(self, offset, window_left):
+        """Shows the wires shifted left by offset, cut off at window_left on screen"""
+        self.offset = offset
+        self.window_left = window_left
+        return self.set_extent(self.extent)
+
+    def grow(self, x, **kwargs):
+        """Animation extending every wire from wherever it is drawn to when the animation starts up to x"""
+        return GrowWires(self, x, **kwargs)
+
+
+class GrowWires(Animation):
+    def __init__(self, wires, x, **kwargs):
+        self.x = x
+        super().__init__(wires, **kwargs)
+
+    def begin(self):
+        # Read the start only now, so grows queued in one Succession chain on from each other
+        self.start = self.mobject.extent
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()  # the wires redraw from their own data, no need to copy them
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_extent(self.start + self.rate_func(alpha) * (self.x - self.start))
@@ -1,4 +1,6 @@
 from manim import *
+from epr_example.tex_cache import Tex, Text
+from epr_example.sphere_mesh import lod_sphere
 
 class TwoEntangledQubits(Scene):
     def construct(self):
@@ -6,8 +8,8 @@ class TwoEntangledQubits(Scene):
         title = Text("Two Entangled Qubits", font_size=40).to_edge(UP)
 
         # Create two Bloch spheres using 3D spheres
-        qubit1 = Sphere(radius=1, resolution=(24, 48)).shift(LEFT * 3)
-        qubit2 = Sphere(radius=1, resolution=(24, 48)).shift(RIGHT * 3)
+        qubit1 = lod_sphere(1, full_resolution=(24, 48)).shift(LEFT * 3)
+        qubit2 = lod_sphere(1, full_resolution=(24, 48)).shift(RIGHT * 3)
 
         qubit1.set_fill(RED, opacity=0.3).set_stroke(WHITE, opacity=0.6)
         qubit2.set_fill(BLUE, opacity=0.3).set_stroke(WHITE, opacity=0.6)
@@ -1,4 +1,5 @@
 from manim import *
+from epr_example.tex_cache import Tex
 
 class EPRCircuit(Scene):
     def construct(self):
@@ -0,0 +1,154 @@
+from epr_example.tex_cache import MathTex
+import numpy as np
+from collections.abc import Mapping
+from epr_example.statevector import GATES
+
+# Lazy registry of gate glyphs: a gate's matrix, its LaTeX and the rendered
+# MathTex, each worked out the first time somebody asks for it.
+#
+# Scenes used to build a MathTex for every gate they might show in __init__,
+# whether or not the circuit contained it. Entries here are created on first
+# lookup and live for the whole process, so every scene instance shares them
+# and a circuit of H and CX only ever compiles H and CX. The matrices come
+# from the statevector engine and the LaTeX is generated from them (for I, X,
+# Y, Z, H and CNOT it comes out exactly as the scenes used to spell it).
+# state_latex does the same for the state vectors of the multi-view scenes.
+
+GATE_SYMBOLS = {
+    "id": "I", "x": "X", "y": "Y", "z": "Z", "h": "H", "s": "S", "sdg": r"S^\dagger", "t": "T", "tdg": r"T^\dagger",
+    "cx": r"\text{CNOT}", "cz": r"\text{CZ}", "swap": r"\text{SWAP}",
+}
+
+
+def _entry_latex(z):
+    """LaTeX of one matrix entry: integers, multiples of i, e^{i k pi / 4} phases, else two decimals"""
+    if abs(z.imag) < 1e-9 and abs(z.real - round(z.real)) < 1e-9:
+        return str(int(round(z.real)))
+    if abs(z.real) < 1e-9 and abs(z.imag - round(z.imag)) < 1e-9:
+        k = int(round(z.imag))
+        return {1: "i", -1: "-i"}.get(k, f"{k}i")
+    eighths = np.angle(z) / (np.pi / 4)
+    if abs(abs(z) - 1) < 1e-9 and abs(eighths - round(eighths)) < 1e-9:
+        k = int(round(eighths))
+        return rf"e^{{{'-' if k < 0 else ''}i{abs(k) if abs(k) != 1 else ''}\pi/4}}"
+    if abs(z.imag) < 1e-9:
+        return f"{z.real:.2f}"
+    if abs(z.real) < 1e-9:
+        return f"{z.imag:.2f}i"
+    return f"{z.real:.2f}{z.imag:+.2f}i"
+
+
+def matrix_latex(symbol, matrix):
+    """`symbol = [matrix]`, pulling out a common 1/sqrt(2) when every non-zero entry has that size"""
+    matrix = np.asarray(matrix, dtype=complex)
+    prefix = ""
+    sizes = np.abs(matrix[np.abs(matrix) > 1e-9])
+    if len(sizes) and np.allclose(sizes, 1 / np.sqrt(2)):
+        matrix = matrix * np.sqrt(2)
+        prefix = r"\frac{1}{\sqrt{2}} "
+    rows = r" \\ ".join(" & ".join(_entry_latex(z) for z in row) for row in matrix)
+    return rf"{symbol} = {prefix}\begin{{bmatrix}} {rows} \end{{bmatrix}}"
+
+
+def state_latex(state, max_terms=8, max_matrix_qubits=3):
+    """`ket sum = [column]` of a statevector, pulling out a common 1/sqrt(k) when every amplitude has that size"""
+    state = np.asarray(state, dtype=complex)
+    n = int(np.log2(len(state)))
+    support = np.flatnonzero(np.abs(state) > 1e-9)
+    prefix, scale = "", 1.0
+    k = 1 / abs(state[support[0]]) ** 2
+    if len(support) > 1 and np.allclose(np.abs(state[support]), abs(state[support[0]])) and abs(k - round(k)) < 1e-6:
+        root = np.sqrt(round(k))
+        prefix = rf"\frac{{1}}{{{int(root)}}}" if abs(root - round(root)) < 1e-9 else rf"\frac{{1}}{{\sqrt{{{round(k)}}}}}"
+        scale = root
+    terms = []
+    for i in support[:max_terms]:
+        z = state[i] * scale
+        coefficient = _entry_latex(z)
+        if "." in coefficient and abs(z.real) > 1e-9 and abs(z.imag) > 1e-9:
+            coefficient = f"({coefficient})"  # a+bi
+        coefficient = {"1": "", "-1": "-"}.get(coefficient, coefficient)
+        term = rf"{coefficient}\ket{{{i:0{n}b}}}"
+        terms.append(term if not terms else (f" - {term[1:]}" if term.startswith("-") else f" + {term}"))
+    if len(support) > max_terms:
+        terms.append(r" + \cdots")
+    kets = "".join(terms)
+    kets = f"{prefix}({kets})" if prefix else kets
+    if n > max_matrix_qubits:
+        return f"${kets}$"
+    column = r" \\ ".join(_entry_latex(z * scale) for z in state)
+    return rf"${kets} = {prefix}\begin{{bmatrix}} {column} \end{{bmatrix}}$"
+
+
+class GateEntry:
+    """Matrix, LaTeX and rendered glyph of one named gate, each built on first use"""
+
+    def __init__(self, name):
+        if name not in GATES:
+            raise KeyError(f"No glyph for gate {name!r}")
+        self.name = name
+        self._latex = None
+        self._glyph = None
+
+    @property
+    def matrix(self):
+        return GATES[self.name]
+
+    @property
+    def symbol(self):
+        return GATE_SYMBOLS.get(self.name, rf"\text{{{self.name.upper()}}}")
+
+    @property
+    def latex(self):
+        if self._latex is None:
+            self._latex = matrix_latex(self.symbol, self.matrix)
+        return self._latex
+
+    @property
+    def shared_glyph(self):
+        """The rendered matrix itself, the same mobject on every access"""
+        if self._glyph is None:
+            self._glyph = MathTex(self.latex)
+        return self._glyph
+
+    def glyph(self):
+        """A fresh copy of the rendered matrix"""
+        return self.shared_glyph.copy()
+
+
+_ENTRIES = {}
+
+
+def gate_entry(name):
+    if name not in _ENTRIES:
+        _ENTRIES[name] = GateEntry(name)
+    return _ENTRIES[name]
+
+
+def gate_glyph(name):
+    """Rendered matrix of the named gate (a copy; the first call for a gate compiles it)"""
+    return gate_entry(name).glyph()
+
+
+class GateGlyphs(Mapping):
+    """Read-only, gates_dict-style view of the registry: glyphs[name] renders on first lookup.
+
+    Like the dict it replaces, every lookup of a name returns the same mobject;
+    use gate_glyph(name) for a copy that can be moved without affecting others.
+    """
+
+    def __getitem__(self, name):
+        return gate_entry(name).shared_glyph
+
+    def __iter__(self):
+        return iter(GATES)
+
+    def __len__(self):
+        return len(GATES)
+
+
+GATE_GLYPHS = GateGlyphs()
+
+
+def clear_gate_glyphs():
+    _ENTRIES.clear()
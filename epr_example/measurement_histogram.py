@@ -0,0 +1,93 @@
+from manim import *
+from epr_example.tex_cache import Tex
+import numpy as np
+from qiskit import QuantumCircuit
+from epr_example.sampling import sample_circuit, frame_shot_counts, histogram_frames
+
+# Animated measurement statistics: bars grow as more and more shots come in.
+# Every frame's counts are computed before anything is drawn, so the updater
+# only looks a row up in a (frames, outcomes) array.
+
+MIN_BAR_HEIGHT = 1e-3  # a bar can't be stretched back up from zero height
+
+
+class ShotHistogramView(VGroup):
+    def __init__(self, labels, frame_counts, frame_shots, height=3.0, bar_width=0.6, color=BLUE, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_shots = np.asarray(frame_shots)
+        # Bar heights for every frame, as fractions of the shots seen so far
+        self.frame_heights = height * frame_counts / self.frame_shots[:, None]
+
+        spacing = bar_width * 1.5
+        self.baseline = Line(LEFT * spacing * len(labels) / 2, RIGHT * spacing * len(labels) / 2, color=WHITE)
+        self.bars = VGroup(*[
+            Rectangle(width=bar_width, height=MIN_BAR_HEIGHT, color=color, fill_opacity=0.7)
+            .move_to(self.baseline.get_left() + RIGHT * spacing * (i + 0.5), aligned_edge=DOWN)
+            for i in range(len(labels))
+        ])
+        self.labels = VGroup(*[
+            Tex(f"${label}$").scale(0.6).next_to(bar, DOWN, buff=0.15)
+            for label, bar in zip(labels, self.bars)
+        ])
+        self.shot_counter = Integer(0).scale(0.7).next_to(self.baseline, UP, buff=height + 0.3)
+        self.add(self.baseline, self.bars, self.labels, self.shot_counter)
+
+        self.frame = ValueTracker(0)
+        self.add_updater(lambda view: view.show_frame(int(round(view.frame.get_value()))))
+
+    @property
+    def num_frames(self):
+        return len(self.frame_shots)
+
+    def show_frame(self, f):
+        bottom = self.baseline.get_center()[1]
+        for bar, h in zip(self.bars, self.frame_heights[f]):
+            bar.stretch_to_fit_height(max(h, MIN_BAR_HEIGHT))
+            bar.move_to([bar.get_center()[0], bottom, 0], aligned_edge=DOWN)
+        self.shot_counter.set_value(self.frame_shots[f])
+        return self
+
+    def grow(self, run_time=4):
+        """Animation running through every frame, from the first shot to the last"""
+        return self.frame.animate(run_time=run_time, rate_func=linear).set_value(self.num_frames - 1)
+
+
+def histogram_from_samples(labels, outcomes, frames=90, **kwargs):
+    """Precomputes every frame of the histogram of already sampled shots"""
+    frame_shots = frame_shot_counts(len(outcomes), frames)
+    frame_counts = histogram_frames(outcomes, len(labels), frame_shots)
+    return ShotHistogramView(labels, frame_counts, frame_shots, **kwargs)
+
+
+def build_histogram_view(qc, shots=1_000_000, frames=90, rng=None, **kwargs):
+    """Samples qc once and precomputes every frame of its histogram"""
+    labels, outcomes = sample_circuit(qc, shots, rng)
+    return histogram_from_samples(labels, outcomes, frames, **kwargs)
+
+
+class MeasurementHistogram(Scene):
+    def __init__(self, qc=None, shots=1_000_000, **kwargs):
+        super().__init__(**kwargs)
+        if qc is None:
+            qc = QuantumCircuit(3, 3)
+            qc.h(0)
+            qc.cx(0, 1)
+            qc.cx(1, 2)
+            qc.measure([0, 1, 2], [0, 1, 2])
+        self.qc = qc
+        self.shots = shots
+
+    def construct(self):
+        title = Tex("Measurement outcomes").to_edge(UP)
+        histogram = build_histogram_view(self.qc, self.shots).move_to(DOWN * 0.5)
+        shots_label = Tex("shots").scale(0.6).next_to(histogram.shot_counter, RIGHT)
+        shots_label.add_updater(lambda m: m.next_to(histogram.shot_counter, RIGHT))
+
+        self.play(Write(title), FadeIn(histogram), FadeIn(shots_label))
+        self.play(histogram.grow())
+        self.wait(2)
+
+
+if __name__ == "__main__":
+    scene = MeasurementHistogram()
+    scene.render()
@@ -0,0 +1,157 @@
+import numpy as np
+from epr_example.statevector import SWAP, gate_matrix, NON_UNITARY
+from epr_example.reduced_states import bloch_from_density
+from epr_example.factorization import entropy_from_schmidt
+
+# Matrix-product-state simulation for wide, weakly entangled registers.
+#
+# Site i holds a tensor of shape (chi_left, 2, chi_right) for qubit i (qubit 0
+# first, as in the statevector engine). Two-qubit gates are applied on
+# neighbouring sites and split back with an SVD that keeps at most max_bond
+# Schmidt values; the probability weight thrown away is reported as the
+# truncation error. Tensors are never modified in place, so copying an MPS
+# for the next time step only copies the list of references.
+
+DEFAULT_MAX_BOND = 64
+SVD_CUTOFF = 1e-12
+
+
+class MPS:
+    def __init__(self, tensors, max_bond=DEFAULT_MAX_BOND, center=0, truncation_error=0.0):
+        self.tensors = list(tensors)
+        self.max_bond = max_bond
+        self.center = center  # orthogonality center: every site left of it is left-canonical, right of it right-canonical
+        self.truncation_error = truncation_error  # total discarded probability weight
+
+    @classmethod
+    def zero_state(cls, num_qubits, max_bond=DEFAULT_MAX_BOND):
+        """|00...0> as a product of bond-dimension-1 tensors"""
+        ket0 = np.array([1, 0], dtype=complex).reshape(1, 2, 1)
+        return cls([ket0] * num_qubits, max_bond)
+
+    @property
+    def num_qubits(self):
+        return len(self.tensors)
+
+    @property
+    def bond_dimensions(self):
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def copy(self):
+        return MPS(self.tensors, self.max_bond, self.center, self.truncation_error)
+
+    # === Canonical form ===
+
+    def _move_center(self, target):
+        while self.center < target:
+            i = self.center
+            left, phys, right = self.tensors[i].shape
+            q, r = np.linalg.qr(self.tensors[i].reshape(left * phys, right))
+            self.tensors[i] = q.reshape(left, phys, -1)
+            self.tensors[i + 1] = np.einsum("ab,bjc->ajc", r, self.tensors[i + 1])
+            self.center += 1
+        while self.center > target:
+            i = self.center
+            left, phys, right = self.tensors[i].shape
+            q, r = np.linalg.qr(self.tensors[i].reshape(left, phys * right).T)
+            self.tensors[i] = q.T.reshape(-1, phys, right)
+            self.tensors[i - 1] = np.einsum("aib,cb->aic", self.tensors[i - 1], r)
+            self.center -= 1
+
+    # === Gates ===
+
+    def apply_single(self, matrix, qubit):
+        """Applies a 2x2 unitary; the canonical form is unaffected"""
+        self.tensors[qubit] = np.einsum("ij,ajb->aib", matrix, self.tensors[qubit])
+
+    def _apply_adjacent(self, matrix, i):
+        """Applies a 4x4 unitary to sites (i, i + 1) and truncates the new bond"""
+        self._move_center(i)
+        theta = np.einsum("aib,bjc->aijc", self.tensors[i], self.tensors[i + 1])
+        theta = np.einsum("ijkl,aklc->aijc", matrix.reshape(2, 2, 2, 2), theta)
+        left, _, _, right = theta.shape
+
+        u, s, vh = np.linalg.svd(theta.reshape(left * 2, 2 * right), full_matrices=False)
+        keep = min(self.max_bond, max(1, int(np.sum(s > SVD_CUTOFF * s[0]))))
+        norm = np.sum(s ** 2)
+        self.truncation_error += float(np.sum(s[keep:] ** 2) / norm)
+        s = s[:keep] / np.sqrt(np.sum(s[:keep] ** 2) / norm)
+
+        self.tensors[i] = u[:, :keep].reshape(left, 2, keep)
+        self.tensors[i + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, right)
+        self.center = i + 1
+
+    def apply_two(self, matrix, a, b):
+        """Applies a 4x4 unitary to qubits (a, b), swapping b next to a first when they are not neighbours"""
+        if a > b:
+            matrix = SWAP @ matrix @ SWAP
+            a, b = b, a
+        for site in range(b - 1, a, -1):
+            self._apply_adjacent(SWAP, site)
+        self._apply_adjacent(matrix, a)
+        for site in range(a + 1, b):
+            self._apply_adjacent(SWAP, site)
+
+    # === Observables ===
+
+    def _environments(self):
+        """Left and right transfer-matrix environments of every site"""
+        n = self.num_qubits
+        lefts = [np.ones((1, 1), dtype=complex)]
+        for tensor in self.tensors[:-1]:
+            lefts.append(np.einsum("ab,aic,bid->cd", lefts[-1], tensor, tensor.conj()))
+        rights = [np.ones((1, 1), dtype=complex)]
+        for tensor in self.tensors[:0:-1]:
+            rights.append(np.einsum("cd,aic,bid->ab", rights[-1], tensor, tensor.conj()))
+        return lefts, rights[::-1][:n]
+
+    def reduced_density_matrices(self):
+        """2x2 reduced density matrix of every qubit, shape (n, 2, 2), in O(n * chi^3)"""
+        lefts, rights = self._environments()
+        rhos = np.stack([
+            np.einsum("ab,aic,bjd,cd->ij", left, tensor, tensor.conj(), right)
+            for left, tensor, right in zip(lefts, self.tensors, rights)
+        ])
+        return rhos / np.trace(rhos, axis1=1, axis2=2)[:, None, None].real
+
+    def bloch_vectors(self):
+        return bloch_from_density(self.reduced_density_matrices())
+
+    def schmidt_values(self):
+        """Schmidt coefficients across every bond, left to right"""
+        mps = self.copy()
+        mps._move_center(0)
+        values = []
+        for i in range(self.num_qubits - 1):
+            left, phys, right = mps.tensors[i].shape
+            u, s, vh = np.linalg.svd(mps.tensors[i].reshape(left * phys, right), full_matrices=False)
+            mps.tensors[i] = u.reshape(left, phys, -1)
+            mps.tensors[i + 1] = np.einsum("ab,bjc->ajc", s[:, None] * vh, mps.tensors[i + 1])
+            values.append(s / np.linalg.norm(s))
+        return values
+
+    def bond_entropies(self):
+        """Entanglement entropy (in bits) between qubits [0, k) and [k, n) for k = 1..n-1"""
+        return np.array([entropy_from_schmidt(s) for s in self.schmidt_values()])
+
+    def to_statevector(self):
+        """Contracts the chain into a dense statevector (only sensible for small registers)"""
+        psi = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            psi = np.einsum("aib,bjc->aijc", psi, tensor).reshape(1, -1, tensor.shape[2])
+        return psi.reshape(-1)
+
+
+def apply_instruction(mps, name, qubits, params=()):
+    """Applies a qiskit-style instruction to a copy of the MPS and returns it"""
+    if name in NON_UNITARY:
+        return mps
+    if len(qubits) > 2:
+        raise ValueError(f"Gate '{name}' acts on {len(qubits)} qubits; the MPS backend supports one- and two-qubit gates only.")
+    mps = mps.copy()
+    matrix = gate_matrix(name, params)
+    if len(qubits) == 1:
+        mps.apply_single(matrix, qubits[0])
+    else:
+        mps.apply_two(matrix, qubits[0], qubits[1])
+    return mps
@@ -0,0 +1,178 @@
+from abc import abstractmethod
+from manim import *
+import numpy as np
+from epr_example.tex_cache import Tex, BRAKET_TEMPLATE
+from epr_example.circuit_layout import gap_intervals
+from epr_example.gate_glyphs import state_latex
+from epr_example.bloch_grid import BlochGrid
+from epr_example.trajectory import get_trajectory, circuit_instructions
+
+# Circuit, vector and Bloch views of the multi-view scenes, built step by step.
+#
+# The multi-view scenes show the circuit so far, the state vector and the
+# qubits' Bloch spheres after every time step. Building each view from scratch
+# per step meant step n redrew every label, wire and gate of steps 1..n-1.
+# Here each view is one persistent mobject that the next step extends: the
+# circuit keeps its columns and only builds the new one, the vector view swaps
+# its Tex, and the Bloch view re-points its arrows. Scenes scale and place a
+# view once; two invisible anchor points (as in CounterText) let later steps
+# land in the right place wherever it has been moved or scaled to. Steps only
+# go forward.
+#
+# circuit_views(qc) drives all three from any QuantumCircuit. Steps count from
+# 1 as in the original EPR walkthrough: step t draws the first t instructions
+# and shows the state going into instruction t, so step 1 is |0...0> with the
+# first gate on screen and the last step repeats the full circuit with the
+# final state. States come from the shared trajectory (one simulation pass,
+# run only as far as the steps shown so far), and a view is only built for a
+# step when the scene asks for it.
+
+
+class StepView(Group):
+    """Group whose later parts follow its moves and scaling, through anchors at its native origin and one unit right of it"""
+
+    def __init__(self, *mobjects):
+        super().__init__(*mobjects)
+        self.anchors = VGroup(VectorizedPoint(ORIGIN), VectorizedPoint(RIGHT))
+        self.add(self.anchors)
+        self.step = None
+
+    def place(self, mob):
+        """mob, built in native coordinates, moved and scaled to where the view is now"""
+        origin, unit = (point.get_center() for point in self.anchors)
+        return mob.scale(np.linalg.norm(unit - origin), about_point=ORIGIN).shift(origin)
+
+    def show_step(self, step):
+        if self.step is not None and step < self.step:
+            raise ValueError(f"Views only step forward (at step {self.step}, asked for {step})")
+        if step != self.step:
+            self.advance(step)
+            self.step = step
+        return self
+
+    @abstractmethod  # enforced: manim's Group metaclass is an ABCMeta
+    def advance(self, step):
+        """Changes the view from self.step to step"""
+
+
+GATE_LABELS = {"measure": "M", "id": "I", "sdg": r"S$^\dagger$", "tdg": r"T$^\dagger$"}
+
+
+def gate_mobject(name, ys, x):
+    """One gate at column x over the wires at heights ys, and the half-width of the gap it leaves in them"""
+    if name == "barrier":
+        return DashedLine([x, max(ys) + 0.4, 0], [x, min(ys) - 0.4, 0], stroke_width=2), 0.0
+
+    if name == "cx":
+        ctrl_y, tgt_y = ys
+        ctrl_dot = Dot(radius=0.07).move_to([x, ctrl_y, 0])
+
+        # Target: circle with cross ("⊕")
+        tgt_circle = Circle(radius=0.2).move_to([x, tgt_y, 0])
+        tgt_cross_v = Line(tgt_circle.get_center() + UP * 0.15, tgt_circle.get_center() + DOWN * 0.15, stroke_width=2)
+        tgt_cross_h = Line(tgt_circle.get_center() + LEFT * 0.15, tgt_circle.get_center() + RIGHT * 0.15, stroke_width=2)
+        tgt_symbol = VGroup(tgt_circle, tgt_cross_v, tgt_cross_h)
+
+        vert_line = Line(ctrl_dot.get_center(), tgt_circle.get_center(), stroke_width=2)
+        return VGroup(ctrl_dot, vert_line, tgt_symbol), 0.2  # tighter CNOT spacing
+
+    # Anything else is a labelled box over the wires it acts on
+    top, bottom = max(ys), min(ys)
+    box = Rectangle(width=0.6, height=top - bottom + 0.6).move_to([x, (top + bottom) / 2, 0])
+    label = Tex(GATE_LABELS.get(name, name.upper())).scale(1.2).move_to(box)
+    return VGroup(box, label), 0.4
+
+
+class CircuitStrip(StepView):
+    """Circuit diagram drawn up to step n, where columns[k] lists the (name, qubits) gates of column k"""
+
+    def __init__(self, num_qubits, columns, column_width=2.5, qubit_spacing=1.2):
+        super().__init__()
+        self.gate_columns = columns
+        self.column_width = column_width
+        self.ys = ((num_qubits - 1) / 2 - np.arange(num_qubits)) * qubit_spacing
+        self.labels = VGroup(*[Tex("$ |0> $").next_to([-0.4, y, 0], LEFT) for y in self.ys])
+        self.columns = VGroup()
+        self.add(self.labels, self.columns)
+
+    def advance(self, step):
+        # Step n shows n columns; once the gates run out the diagram stays as it is
+        while len(self.columns) < min(step, len(self.gate_columns)):
+            self.columns.add(self.place(self.build_column(len(self.columns))))
+
+    def build_column(self, k):
+        """Wires and gates of column k, in native coordinates"""
+        x0, x1 = k * self.column_width, (k + 1) * self.column_width
+        mid = (x0 + x1) / 2
+        gaps = [0.0] * len(self.ys)
+        gates = []
+        for name, qubits in self.gate_columns[k]:
+            gate, half_gap = gate_mobject(name, [self.ys[q] for q in qubits], mid)
+            for q in qubits:
+                gaps[q] = half_gap
+            gates.append(gate)
+        wires = [
+            Line([a, y, 0], [b, y, 0])
+            for y, gap in zip(self.ys, gaps)
+            for a, b in gap_intervals(x0, x1, [mid] if gap else [], gap)
+        ]
+        return VGroup(*wires, *gates)
+
+
+class VectorView(StepView):
+    """State vector of step n, from the Tex string latex(n)"""
+
+    def __init__(self, latex, max_width=12.0, tex_template=BRAKET_TEMPLATE):
+        super().__init__()
+        self.latex = latex
+        self.max_width = max_width
+        self.tex_template = tex_template
+        self.content = VGroup()
+        self.add(self.content)
+
+    def advance(self, step):
+        tex = Tex(self.latex(step), tex_template=self.tex_template)
+        if tex.width > self.max_width:
+            tex.scale_to_fit_width(self.max_width)  # long kets shrink on their own, not the view
+        self.remove(self.content)
+        self.content = self.place(tex)
+        self.add(self.content)
+
+
+class BlochView(StepView):
+    """One projected Bloch sphere per qubit, its arrow pointing at vectors(n) (shape (qubits, 3)) at step n"""
+
+    def __init__(self, num_qubits, vectors, **grid_kwargs):
+        super().__init__()
+        self.vectors = vectors
+        self.grid = BlochGrid(num_qubits, **grid_kwargs)  # follows its own moves and scaling
+        self.add(self.grid)
+
+    def advance(self, step):
+        self.grid.set_vectors(self.vectors(step))
+
+
+class MultiView:
+    """Circuit, vector and Bloch views of one walkthrough, each step built from the previous one's mobjects"""
+
+    def __init__(self, circuit, vector, bloch):
+        self.circuit = circuit
+        self.vector = vector
+        self.bloch = bloch
+        self.steps = range(1, len(circuit.gate_columns) + 2)
+
+    def show_step(self, step):
+        """The views at step, ready to place and fade in (vector is None when the state isn't a statevector)"""
+        views = (self.circuit, self.vector, self.bloch)
+        return tuple(view.show_step(step) if view is not None else None for view in views)
+
+
+def circuit_views(qc, backend="auto"):
+    """Multi-view of qc with one column per instruction; step t shows the state after its first t - 1 instructions"""
+    trajectory = get_trajectory(qc, backend)
+    columns = [[(name, list(qubits))] for name, qubits, _, _ in circuit_instructions(qc)]
+    circuit = CircuitStrip(qc.num_qubits, columns)
+    # Only a dense statevector has amplitudes to write out
+    vector = VectorView(lambda t: state_latex(trajectory.state(t - 1))) if trajectory.backend.name == "statevector" else None
+    bloch = BlochView(qc.num_qubits, lambda t: trajectory.bloch_vectors(t - 1))
+    return MultiView(circuit, vector, bloch)
@@ -1,43 +1,24 @@
 from manim import *
-from two_bloch import TwoQubitColoredBlochSpheres
-from circuit import Circuit
-from entangled_qubits import TwoEntangledQubits
-from vector import EPRPairMatrixWalkthrough
+from epr_example.tex_cache import Tex, Text, BRAKET_TEMPLATE, PrecompiledTexScene
+from epr_example.two_bloch import TwoQubitColoredBlochSpheres
+from epr_example.circuit import Circuit
+from epr_example.entangled_qubits import TwoEntangledQubits
+from epr_example.vector import EPRPairMatrixWalkthrough
+from qiskit import QuantumCircuit
+from epr_example.trajectory import get_trajectory
+from epr_example.reduced_states import bloch_vectors
+from epr_example.bloch_view import BlochSphereView
 
 # THIS IS THE CODE WE NEED TO EDIT 5/2/25
 
-class QuantumReps(ThreeDScene):
-    def get_bloch_sphere(self, sphere_color=BLUE, state_vector_endpoint=[0, 0, 1.5]):
-        state_vector_endpoint = np.array(state_vector_endpoint, dtype=float)
-        bloch_sphere = Sphere(radius=1)
-        bloch_sphere.set_fill(color=sphere_color, opacity=0.5)
-        bloch_sphere.set_stroke(color=sphere_color, opacity=0.6)
-
-        x_axis = Arrow3D(start=[-1.5, 0, 0], end=[1.5, 0, 0], color=WHITE)
-        y_axis = Arrow3D(start=[0, -1.5, 0], end=[0, 1.5, 0], color=WHITE)
-        z_axis = Arrow3D(start=[0, 0, -1.5], end=[0, 0, 1.5], color=WHITE)
-        state_vector_arrow = Arrow3D(start=[0, 0, 0], end=state_vector_endpoint, color=RED)
-
-        def state_label(tex_str, pos):
-            return Tex(tex_str, color=WHITE).move_to(pos).rotate(PI / 2, axis=RIGHT).rotate(PI - PI / 6, axis=OUT)
-
-        ket_0 = state_label(r"$\left|0\right\rangle$", z_axis.get_end() + 0.3 * OUT)
-        ket_1 = state_label(r"$\left|1\right\rangle$", z_axis.get_start() + 0.3 * IN)
-        ket_plus = state_label(r"$\left|+\right\rangle$", x_axis.get_end() + 0.3 * RIGHT)
-        ket_minus = state_label(r"$\left|-\right\rangle$", x_axis.get_start() + 0.3 * LEFT)
-        ket_plus_i = state_label(r"$\left|+i\right\rangle$", y_axis.get_end() + 0.3 * UP)
-        ket_minus_i = state_label(r"$\left|-i\right\rangle$", y_axis.get_start() + 0.3 * DOWN)
-
-        axes_group = VGroup(x_axis, y_axis, z_axis)
-        state_labels = VGroup(ket_0, ket_1, ket_plus, ket_minus, ket_plus_i, ket_minus_i)
-        bloch_group = VGroup(bloch_sphere, axes_group, state_labels, state_vector_arrow)
-        bloch_group.scale(1.2)
-
-        return bloch_group
-
+class QuantumReps(PrecompiledTexScene, ThreeDScene):
     def construct(self):
-        tex_template = TexTemplate()
-        tex_template.add_to_preamble(r"\usepackage{braket}")
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        bloch = bloch_vectors(get_trajectory(qc).states)  # indexed [time step, qubit]
+
+        tex_template = BRAKET_TEMPLATE
 
         original_phi = self.camera.get_phi()
         original_theta = self.camera.get_theta()
@@ -110,8 +91,8 @@ class QuantumReps(ThreeDScene):
         caption = Text("Bloch Sphere after H gate", font_size=28).to_corner(UL).set_opacity(0.85)
         self.play(FadeIn(caption))
         self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
-        red_qubit = self.get_bloch_sphere(sphere_color=YELLOW, state_vector_endpoint=[1, 0, 0]).scale(0.45).shift(RIGHT * 2.5)
-        blue_qubit = self.get_bloch_sphere(sphere_color=YELLOW, state_vector_endpoint=[0, 1, 0]).scale(0.45).shift(RIGHT * 4.5)
+        red_qubit = BlochSphereView(sphere_color=YELLOW, state_vector_endpoint=bloch[1][0], screen_radius=1.2 * 0.45).scale(0.45).shift(RIGHT * 2.5)
+        blue_qubit = BlochSphereView(sphere_color=YELLOW, state_vector_endpoint=bloch[1][1], screen_radius=1.2 * 0.45).scale(0.45).shift(RIGHT * 4.5)
         bloch_view_h = VGroup(red_qubit, blue_qubit)
         self.play(FadeIn(bloch_view_h))
         self.wait(3)
@@ -150,8 +131,8 @@ class QuantumReps(ThreeDScene):
         caption = Text("Bloch Sphere of EPR pair", font_size=28).to_corner(UL).set_opacity(0.85)
         self.play(FadeIn(caption))
         self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
-        qubit1 = self.get_bloch_sphere(sphere_color=YELLOW, state_vector_endpoint=[1, 0, 0]).scale(0.45).shift(RIGHT * 2.5)
-        qubit2 = self.get_bloch_sphere(sphere_color=YELLOW, state_vector_endpoint=[0, 1, 0]).scale(0.45).shift(RIGHT * 4.5)
+        qubit1 = BlochSphereView(sphere_color=YELLOW, state_vector_endpoint=bloch[2][0], screen_radius=1.2 * 0.45).scale(0.45).shift(RIGHT * 2.5)
+        qubit2 = BlochSphereView(sphere_color=YELLOW, state_vector_endpoint=bloch[2][1], screen_radius=1.2 * 0.45).scale(0.45).shift(RIGHT * 4.5)
         bloch_view = VGroup(qubit1, qubit2)
         self.play(FadeIn(bloch_view))
         self.wait(3)
@@ -0,0 +1,101 @@
+import numpy as np
+from epr_example.statevector import I, X, Y, Z
+from epr_example.reduced_states import bloch_from_density
+
+# Single-qubit noise channels on density matrices.
+#
+# A channel is given by its Kraus operators K_k and applied as a 4x4
+# superoperator S = sum_k K_k (x) conj(K_k) acting on the row-major flattened
+# density matrix, so any stack of qubits (..., 2, 2) can be pushed through a
+# stack of channels (..., 4, 4) with one matmul. Channel strengths may be
+# arrays: depolarizing_kraus(np.linspace(0, 1, 60)) is 60 channels at once,
+# which is how per-frame trajectories are built.
+
+
+def _stack(operators):
+    """Kraus operators (each (..., 2, 2)) stacked along a new axis, shape (..., k, 2, 2)"""
+    operators = np.broadcast_arrays(*[np.asarray(op, dtype=complex) for op in operators])
+    return np.stack(operators, axis=-3)
+
+
+def _strength(p):
+    return np.asarray(p, dtype=float)[..., None, None]
+
+
+def depolarizing_kraus(p):
+    """rho -> (1 - p) rho + p I/2"""
+    p = _strength(p)
+    return _stack([np.sqrt(1 - 3 * p / 4) * I, np.sqrt(p / 4) * X, np.sqrt(p / 4) * Y, np.sqrt(p / 4) * Z])
+
+
+def amplitude_damping_kraus(gamma):
+    """Energy relaxation towards |0> with decay probability gamma (gamma = 1 - exp(-t / T1))"""
+    gamma = _strength(gamma)
+    k0 = np.array([[1, 0], [0, 0]]) + np.sqrt(1 - gamma) * np.array([[0, 0], [0, 1]])
+    k1 = np.sqrt(gamma) * np.array([[0, 1], [0, 0]])
+    return _stack([k0, k1])
+
+
+def phase_damping_kraus(lam):
+    """Dephasing: off-diagonal terms shrink by sqrt(1 - lam), populations are untouched"""
+    lam = _strength(lam)
+    k0 = np.array([[1, 0], [0, 0]]) + np.sqrt(1 - lam) * np.array([[0, 0], [0, 1]])
+    k1 = np.sqrt(lam) * np.array([[0, 0], [0, 1]])
+    return _stack([k0, k1])
+
+
+def mixed_unitary_kraus(unitaries, probs):
+    """Applies unitaries[k] with probability probs[k]"""
+    return _stack([np.sqrt(_strength(p)) * np.asarray(u) for u, p in zip(unitaries, probs)])
+
+
+def superoperator(kraus):
+    """(..., k, 2, 2) Kraus operators to the (..., 4, 4) matrix acting on flattened density matrices"""
+    kraus = np.asarray(kraus, dtype=complex)
+    s = np.einsum("...kij,...klm->...iljm", kraus, kraus.conj())
+    return s.reshape(s.shape[:-4] + (4, 4))
+
+
+def compose(*superops):
+    """Channel applying superops[0] first, then superops[1], ..."""
+    result = superops[0]
+    for s in superops[1:]:
+        result = np.matmul(s, result)
+    return result
+
+
+def apply_superoperator(rhos, superops):
+    """Pushes (..., 2, 2) density matrices through broadcastable (..., 4, 4) superoperators"""
+    rhos = np.asarray(rhos, dtype=complex)
+    vec = rhos.reshape(rhos.shape[:-2] + (4, 1))
+    out = np.matmul(superops, vec)
+    return out.reshape(out.shape[:-2] + (2, 2))
+
+
+def apply_channel(rho, kraus, qubit):
+    """Applies single-qubit Kraus operators (k, 2, 2) to one qubit of an n-qubit density matrix (2^n, 2^n)"""
+    dim = rho.shape[0]
+    n = dim.bit_length() - 1
+    tensor = np.asarray(rho, dtype=complex).reshape((2,) * (2 * n))
+    out = np.zeros_like(tensor)
+    for k in kraus:
+        # K on the row index of the qubit, conj(K) on its column index
+        term = np.moveaxis(np.tensordot(k, tensor, axes=([1], [qubit])), 0, qubit)
+        term = np.moveaxis(np.tensordot(k.conj(), term, axes=([1], [n + qubit])), 0, n + qubit)
+        out += term
+    return out.reshape(dim, dim)
+
+
+def channel_trajectory(rhos, superops):
+    """Every frame's states, shape (frames, ..., 2, 2), from initial rhos (..., 2, 2) and per-frame channels (frames, ..., 4, 4)"""
+    return apply_superoperator(np.asarray(rhos)[None], superops)
+
+
+def bloch_lengths(rhos):
+    """Length of the Bloch vector of (..., 2, 2) density matrices: 1 when pure, 0 when maximally mixed"""
+    return np.linalg.norm(bloch_from_density(rhos), axis=-1)
+
+
+def density_purities(rhos):
+    """Tr(rho^2) of (..., 2, 2) density matrices"""
+    return (1 + bloch_lengths(rhos) ** 2) / 2
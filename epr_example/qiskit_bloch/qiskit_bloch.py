@@ -1,10 +1,9 @@
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import Statevector, DensityMatrix, Pauli
+from qiskit import QuantumCircuit
 from qiskit.visualization import plot_bloch_vector
-import numpy as np
 import matplotlib.pyplot as plt
 import os
+from epr_example.batch import simulate_batch
+from epr_example.reduced_states import bloch_vectors
 
 os.makedirs("images", exist_ok=True)
 
@@ -15,21 +14,9 @@ save_path = "images/bloch_plus_state.png"  # Change this as needed (e.g. "output
 qc = QuantumCircuit(1)
 qc.h(0)  # Apply Hadamard gate
 
-# Save the statevector
-qc.save_statevector()
-
-# Transpile and simulate
-simulator = AerSimulator()
-t_qc = transpile(qc, simulator)
-result = simulator.run(t_qc).result()
-state = Statevector(result.get_statevector())
-
-# Convert to density matrix
-dm = DensityMatrix(state)
-
-# Compute Bloch vector
-paulis = [Pauli("X"), Pauli("Y"), Pauli("Z")]
-bloch_vector = [np.real(dm.expectation_value(p)) for p in paulis]
+# Simulate (a batch of one) and read the Bloch vector straight off the statevector
+states = simulate_batch([qc])
+bloch_vector = bloch_vectors(states)[0, 0]
 
 # Plot Bloch vector
 fig = plot_bloch_vector(bloch_vector, title="Bloch Sphere: |+⟩ State")
@@ -1,58 +1,32 @@
 from manim import *
-from two_bloch import TwoQubitColoredBlochSpheres
-from circuit import Circuit
-from entangled_qubits import TwoEntangledQubits
-from vector import EPRPairMatrixWalkthrough
+from epr_example.tex_cache import Tex, Text, BRAKET_TEMPLATE, PrecompiledTexScene
+from epr_example.sphere_mesh import lod_sphere
+from epr_example.two_bloch import TwoQubitColoredBlochSpheres
+from epr_example.circuit import Circuit
+from epr_example.entangled_qubits import TwoEntangledQubits
+from epr_example.vector import EPRPairMatrixWalkthrough
+from qiskit import QuantumCircuit
+from epr_example.trajectory import get_trajectory
+from epr_example.reduced_states import bloch_vectors
+from epr_example.bloch_view import BlochSphereView
+from epr_example.factorization import factorize
 
 """
 TODO:
 Add ket 0 to circuit view
-Show product state breakdowns when it can be done
 Qiskit can make Bloch spheres
 """
 
-class QuantumReps(ThreeDScene):
-    def get_bloch_sphere(self, sphere_color=BLUE, state_vector_endpoint=[0, 0, 1.5]):
-        # Ensure correct type for vector arithmetic
-        state_vector_endpoint = np.array(state_vector_endpoint, dtype=float)
-
-        # Bloch Sphere
-        bloch_sphere = Sphere(radius=1)
-        bloch_sphere.set_fill(color=sphere_color, opacity=0.5)
-        bloch_sphere.set_stroke(color=sphere_color, opacity=0.6)
-
-        # Axes
-        x_axis = Arrow3D(start=[-1.5, 0, 0], end=[1.5, 0, 0], color=WHITE)
-        y_axis = Arrow3D(start=[0, -1.5, 0], end=[0, 1.5, 0], color=WHITE)
-        z_axis = Arrow3D(start=[0, 0, -1.5], end=[0, 0, 1.5], color=WHITE)
-
-        # State vector
-        state_vector_arrow = Arrow3D(start=[0, 0, 0], end=state_vector_endpoint, color=RED)
-
-        # Helper for state labels
-        def state_label(tex_str, pos):
-            return Tex(tex_str, color=WHITE).move_to(pos).rotate(PI / 2, axis=RIGHT).rotate(PI - PI / 6, axis=OUT)
-
-        # Labels
-        ket_0 = state_label(r"$\left|0\right\rangle$", z_axis.get_end() + 0.3 * OUT)
-        ket_1 = state_label(r"$\left|1\right\rangle$", z_axis.get_start() + 0.3 * IN)
-        ket_plus = state_label(r"$\left|+\right\rangle$", x_axis.get_end() + 0.3 * RIGHT)
-        ket_minus = state_label(r"$\left|-\right\rangle$", x_axis.get_start() + 0.3 * LEFT)
-        ket_plus_i = state_label(r"$\left|+i\right\rangle$", y_axis.get_end() + 0.3 * UP)
-        ket_minus_i = state_label(r"$\left|-i\right\rangle$", y_axis.get_start() + 0.3 * DOWN)
-
-        # Grouping
-        axes_group = VGroup(x_axis, y_axis, z_axis)
-        state_labels = VGroup(ket_0, ket_1, ket_plus, ket_minus, ket_plus_i, ket_minus_i)
-        bloch_group = VGroup(bloch_sphere, axes_group, state_labels, state_vector_arrow)
-        bloch_group.scale(1.2)
-
-        return bloch_group
-    
+class QuantumReps(PrecompiledTexScene, ThreeDScene):
     def construct(self):
 
-        tex_template = TexTemplate()
-        tex_template.add_to_preamble(r"\usepackage{braket}")
+        # One simulation pass of the EPR circuit feeds every Bloch view below
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        bloch = bloch_vectors(get_trajectory(qc).states)  # indexed [time step, qubit]
+
+        tex_template = BRAKET_TEMPLATE
 
         original_phi = self.camera.get_phi()
         original_theta = self.camera.get_theta()
@@ -196,14 +170,16 @@ class QuantumReps(ThreeDScene):
 
         self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
 
-        red_qubit = self.get_bloch_sphere(
+        red_qubit = BlochSphereView(
             sphere_color=YELLOW,
-            state_vector_endpoint=[1, 0, 0]
+            state_vector_endpoint=bloch[0][0],
+            screen_radius=1.2 * 0.6  # shrunk with both_spheres below
         ).shift(RIGHT * 3 + DOWN * 0.5 + IN * 1.5)
 
-        blue_qubit = self.get_bloch_sphere(
+        blue_qubit = BlochSphereView(
             sphere_color=YELLOW,
-            state_vector_endpoint=[0, 1, 0]
+            state_vector_endpoint=bloch[0][1],
+            screen_radius=1.2 * 0.6  # shrunk with both_spheres below
         ).shift(LEFT * 3 + UP * 0.2 + OUT * 0.5)
 
         # Group both Bloch spheres and scale to fit frame
@@ -249,8 +225,7 @@ class QuantumReps(ThreeDScene):
         text.to_corner(UL).set_opacity(0.85)
         self.play(FadeIn(text))
 
-        tex_template = TexTemplate()
-        tex_template.add_to_preamble(r"\usepackage{braket}")
+        tex_template = BRAKET_TEMPLATE
 
         ## Stage 2: Apply H ⊗ I
         h_step_label = Tex(r"Apply $H \otimes I$ on $\ket{00}$:", font_size=36, tex_template=tex_template)
@@ -286,14 +261,16 @@ class QuantumReps(ThreeDScene):
 
         self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
 
-        red_qubit = self.get_bloch_sphere(
+        red_qubit = BlochSphereView(
             sphere_color=YELLOW,
-            state_vector_endpoint=[1, 0, 0]
+            state_vector_endpoint=bloch[1][0],
+            screen_radius=1.2 * 0.6  # shrunk with both_spheres below
         ).shift(RIGHT * 3 + DOWN * 0.5 + IN * 1.5)
 
-        blue_qubit = self.get_bloch_sphere(
+        blue_qubit = BlochSphereView(
             sphere_color=YELLOW,
-            state_vector_endpoint=[0, 1, 0]
+            state_vector_endpoint=bloch[1][1],
+            screen_radius=1.2 * 0.6  # shrunk with both_spheres below
         ).shift(LEFT * 3 + UP * 0.2 + OUT * 0.5)
 
         # Group both Bloch spheres and scale to fit frame
@@ -388,8 +365,8 @@ class QuantumReps(ThreeDScene):
         title = Text("Two Entangled Qubits", font_size=40).to_edge(UP)
 
         # Create two Bloch spheres using 3D spheres
-        qubit1 = Sphere(radius=1, resolution=(24, 48)).shift(LEFT * 3)
-        qubit2 = Sphere(radius=1, resolution=(24, 48)).shift(RIGHT * 3)
+        qubit1 = lod_sphere(1, full_resolution=(24, 48)).shift(LEFT * 3)
+        qubit2 = lod_sphere(1, full_resolution=(24, 48)).shift(RIGHT * 3)
 
         qubit1.set_fill(RED, opacity=0.3).set_stroke(WHITE, opacity=0.6)
         qubit2.set_fill(BLUE, opacity=0.3).set_stroke(WHITE, opacity=0.6)
@@ -397,12 +374,23 @@ class QuantumReps(ThreeDScene):
         label1 = Tex(r"$Q_1$").next_to(qubit1, DOWN)
         label2 = Tex(r"$Q_2$").next_to(qubit2, DOWN)
 
+        # Product state breakdown of the final state decides what gets drawn:
+        # separable qubits get their own Bloch vector, entangled ones get a link
+        breakdown = factorize(get_trajectory(qc)[-1])
+        spheres = [qubit1, qubit2]
+
         # Arrows representing Bloch vectors
-        vec1 = Arrow3D(start=qubit1.get_center(), end=qubit1.get_center() + OUT, color=YELLOW)
-        vec2 = Arrow3D(start=qubit2.get_center(), end=qubit2.get_center() + OUT, color=YELLOW)
+        vectors = [
+            Arrow3D(start=sphere.get_center(), end=sphere.get_center() + bloch[-1][q], color=YELLOW)
+            for q, sphere in enumerate(spheres) if breakdown.is_separable(q)
+        ]
 
         # A line indicating entanglement between the two qubits
         entangled_line = DashedLine(qubit1.get_center(), qubit2.get_center(), color=PURPLE)
+        entangled_lines = [
+            DashedLine(spheres[a].get_center(), spheres[b].get_center(), color=PURPLE)
+            for a, b in breakdown.entangled_pairs()
+        ]
 
         # Optional: State label
         entangled_state = Tex(r"$|\Phi^+\rangle = \frac{1}{\sqrt{2}}(|00\rangle + |11\rangle)$", font_size=36)
@@ -410,8 +398,9 @@ class QuantumReps(ThreeDScene):
 
         self.add(title)
         self.play(FadeIn(qubit1, qubit2), FadeIn(label1, label2))
-        self.play(Create(vec1), Create(vec2))
-        self.play(Create(entangled_line), Write(entangled_state))
+        if vectors:
+            self.play(*[Create(vec) for vec in vectors])
+        self.play(*[Create(line) for line in entangled_lines], Write(entangled_state))
         self.wait(2)
 
         self.clear()
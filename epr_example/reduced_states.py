@@ -0,0 +1,48 @@
+import numpy as np
+from epr_example.statevector import num_qubits_of
+
+# Single-qubit reduced states for every qubit of a register.
+#
+# Works on one statevector of shape (2^n,) or a batch of shape (..., 2^n), e.g.
+# a whole StateTrajectory.states array. Each partial trace is a reshape plus one
+# einsum over the other qubits, so all n reduced states cost O(n * 2^n) instead
+# of building a 4^n DensityMatrix and an expectation value per Pauli.
+
+
+def reduced_density_matrices(states):
+    """Returns the 2x2 reduced density matrix of every qubit, shape (..., n, 2, 2)"""
+    states = np.asarray(states, dtype=complex)
+    n = num_qubits_of(states)
+    batch = states.shape[:-1]
+    rhos = np.empty(batch + (n, 2, 2), dtype=complex)
+    for q in range(n):
+        # Split the index into (qubits before q, qubit q, qubits after q) and trace out the outer two
+        psi = states.reshape(batch + (2 ** q, 2, 2 ** (n - q - 1)))
+        rhos[..., q, :, :] = np.einsum("...aib,...ajb->...ij", psi, psi.conj())
+    return rhos
+
+
+def bloch_from_density(rhos):
+    """Bloch vectors (x, y, z) of 2x2 density matrices, shape (..., 3)"""
+    rhos = np.asarray(rhos)
+    x = 2 * rhos[..., 0, 1].real
+    y = -2 * rhos[..., 0, 1].imag
+    z = (rhos[..., 0, 0] - rhos[..., 1, 1]).real
+    return np.stack([x, y, z], axis=-1)
+
+
+def bloch_vectors(states):
+    """Returns the Bloch vector of every qubit, shape (..., n, 3)"""
+    return bloch_from_density(reduced_density_matrices(states))
+
+
+def purities(states):
+    """Returns Tr(rho^2) of every qubit, shape (..., n); 1 for a pure qubit, 1/2 for a maximally mixed one"""
+    vectors = bloch_vectors(states)
+    return (1 + np.sum(vectors ** 2, axis=-1)) / 2
+
+
+def bloch_vectors_and_purities(states):
+    """Both per-qubit Bloch vectors (..., n, 3) and purities (..., n) from a single pass"""
+    vectors = bloch_vectors(states)
+    return vectors, (1 + np.sum(vectors ** 2, axis=-1)) / 2
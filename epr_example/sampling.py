@@ -0,0 +1,168 @@
+import numpy as np
+from epr_example.statevector import num_qubits_of
+from epr_example.stabilizer import Tableau
+from epr_example.trajectory import circuit_instructions, get_trajectory
+
+# Measurement sampling.
+#
+# Shots are drawn from a statevector by inverting its cumulative probabilities
+# with searchsorted (one vectorized lookup per chunk of shots), or from a
+# stabilizer tableau through its affine measurement map, so millions of shots
+# cost a few array passes. Histograms are accumulated per animation frame up
+# front, so a view only has to index a precomputed (frames, outcomes) array.
+
+# Shots drawn per vectorized pass, to keep the uniform draws a few MB at most
+SHOT_CHUNK = 2 ** 20
+
+
+def marginal_probabilities(state, qubits=None):
+    """Z-basis outcome probabilities of `qubits` (all by default), qubits[0] being the most significant bit"""
+    n = num_qubits_of(state)
+    qubits = list(range(n)) if qubits is None else list(qubits)
+    probs = (np.abs(np.asarray(state)) ** 2).reshape((2,) * n)
+    others = tuple(q for q in range(n) if q not in qubits)
+    probs = np.sum(probs, axis=others)
+    # The remaining axes are in ascending qubit order; put them in the requested order
+    probs = np.transpose(probs, np.argsort(np.argsort(qubits)))
+    return probs.reshape(-1)
+
+
+def _chunks(shots, chunk=SHOT_CHUNK):
+    for start in range(0, shots, chunk):
+        yield min(chunk, shots - start)
+
+
+def sample_outcomes(probs, shots, rng=None):
+    """Draws `shots` outcome indices from a probability vector via its cumulative distribution"""
+    rng = np.random.default_rng(rng)
+    cdf = np.cumsum(probs)
+    cdf /= cdf[-1]
+    dtype = np.min_scalar_type(len(cdf) - 1)
+    outcomes = np.empty(shots, dtype=dtype)
+    start = 0
+    for size in _chunks(shots):
+        # side="right" so an outcome with zero probability is never picked
+        drawn = np.searchsorted(cdf, rng.random(size), side="right")
+        outcomes[start:start + size] = np.minimum(drawn, len(cdf) - 1)
+        start += size
+    return outcomes
+
+
+def sample_counts(probs, shots, rng=None):
+    """Outcome counts of `shots` draws, without ever holding every shot in memory"""
+    rng = np.random.default_rng(rng)
+    counts = np.zeros(len(probs), dtype=np.int64)
+    for size in _chunks(shots):
+        counts += np.bincount(sample_outcomes(probs, size, rng), minlength=len(probs))
+    return counts
+
+
+def bits_to_outcomes(bits):
+    """Rows of measured bits (most significant first) to outcome indices"""
+    bits = np.asarray(bits, dtype=np.int64)
+    return bits @ (1 << np.arange(bits.shape[-1] - 1, -1, -1, dtype=np.int64))
+
+
+def _span_basis(masks):
+    """A linearly independent (over XOR) subset of masks spanning the same outcomes"""
+    basis = {}  # highest set bit -> mask
+    for mask in masks:
+        mask = int(mask)
+        while mask:
+            top = mask.bit_length() - 1
+            if top not in basis:
+                basis[top] = mask
+                break
+            mask ^= basis[top]
+    return list(basis.values())
+
+
+def sample_tableau(tableau, qubits, shots, rng=None):
+    """Draws `shots` outcome indices of measuring `qubits` on a stabilizer state, without collapsing it"""
+    if len(qubits) > 62:
+        raise ValueError(f"Cannot index the outcomes of {len(qubits)} measured qubits; sample fewer at a time.")
+    rng = np.random.default_rng(rng)
+    base, generators = tableau.measurement_map(qubits)
+    # Shots are uniform over base ^ span(generators), so an independent basis of at most
+    # len(qubits) masks needs only one random bit each, however many coins the tableau used
+    basis = _span_basis(bits_to_outcomes(generators)) if len(generators) else []
+    # XOR every combination of 8 basis masks once, then look up to 8 random bits up at a time
+    tables = []
+    for start in range(0, len(basis), 8):
+        group = basis[start:start + 8]
+        table = np.zeros(2 ** len(group), dtype=np.int64)
+        for j, mask in enumerate(group):
+            table[1 << j:2 << j] = table[:1 << j] ^ mask
+        tables.append(table)
+
+    outcomes = np.full(shots, int(bits_to_outcomes(base)), dtype=np.int64)
+    start = 0
+    for size in _chunks(shots):
+        for table in tables:
+            outcomes[start:start + size] ^= table[rng.integers(0, len(table), size=size)]
+        start += size
+    return outcomes
+
+
+def measured_bits(qc):
+    """(qubit, clbit) of every measurement, ordered like qiskit's count keys (highest clbit first)"""
+    pairs = {}
+    for name, qubits, clbits, _ in circuit_instructions(qc):
+        if name == "measure":
+            pairs[clbits[0]] = qubits[0]
+    return [(pairs[c], c) for c in sorted(pairs, reverse=True)]
+
+
+def sample_circuit(qc, shots, rng=None, backend="auto"):
+    """Samples the measurements of qc, returning (outcome labels, outcome indices of every shot).
+
+    Measurements are treated as terminal (as in every circuit the scenes draw):
+    shots are drawn from the state just before the first one.
+    """
+    pairs = measured_bits(qc)
+    if not pairs:
+        raise ValueError("The circuit has no measurements to sample.")
+    qubits = [q for q, _ in pairs]
+    labels = [format(i, f"0{len(pairs)}b") for i in range(2 ** len(pairs))]
+
+    trajectory = get_trajectory(qc, backend)
+    first_measure = next(t for t, (name, *_) in enumerate(trajectory.instructions) if name == "measure")
+    state = trajectory.state(first_measure)
+    if isinstance(state, Tableau):
+        return labels, sample_tableau(state, qubits, shots, rng)
+    if isinstance(state, np.ndarray):
+        return labels, sample_outcomes(marginal_probabilities(state, qubits), shots, rng)
+    raise ValueError(f"Sampling from a '{trajectory.backend.name}' state is not supported; use the statevector or stabilizer backend.")
+
+
+def frame_shot_counts(shots, frames):
+    """Cumulative number of shots shown at each frame, growing geometrically so the first few shots are visible"""
+    return np.unique(np.geomspace(1, shots, frames).astype(np.int64))
+
+
+def histogram_frames(outcomes, num_outcomes, frame_ends):
+    """Counts after the first frame_ends[f] shots for every frame f, shape (frames, num_outcomes), in one bincount"""
+    frame_ends = np.asarray(frame_ends)
+    outcomes = np.asarray(outcomes[:frame_ends[-1]], dtype=np.int64)
+    # The frame each shot first shows up in
+    frame_of_shot = np.searchsorted(frame_ends, np.arange(len(outcomes)), side="right")
+    new_counts = np.bincount(frame_of_shot * num_outcomes + outcomes, minlength=len(frame_ends) * num_outcomes)
+    return np.cumsum(new_counts.reshape(len(frame_ends), num_outcomes), axis=0)
+
+
+class ShotHistogram:
+    """Running outcome counts, for when shots arrive in batches"""
+
+    def __init__(self, num_outcomes):
+        self.counts = np.zeros(num_outcomes, dtype=np.int64)
+
+    @property
+    def shots(self):
+        return int(self.counts.sum())
+
+    def add(self, outcomes):
+        self.counts += np.bincount(outcomes, minlength=len(self.counts))
+        return self.counts
+
+    def frequencies(self):
+        return self.counts / max(self.shots, 1)
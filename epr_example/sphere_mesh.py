@@ -0,0 +1,51 @@
+from manim import *
+import math
+
+# Level of detail and a mesh cache for Sphere surfaces.
+#
+# Tessellating a Sphere evaluates its surface function on a (u, v) grid and
+# builds one polygon per facet, so a thumbnail sphere at full resolution pays
+# for facets a few pixels across. lod_resolution() picks the grid of a sphere
+# that will be shrunk into an inset from its on-screen radius at the current
+# render quality; spheres shown at full size keep their full resolution.
+# cached_sphere() tessellates each (radius, resolution) once and hands out
+# copies.
+
+PIXELS_PER_FACET = 16  # aim for facets about this tall on screen
+MIN_RESOLUTION = (8, 4)
+MAX_INSET_RESOLUTION = (30, 15)
+
+_MESHES = {}
+
+
+def lod_resolution(screen_radius, full_radius, full_resolution=None, pixel_width=None):
+    """(u, v) grid for a sphere of radius `full_radius` shown `screen_radius` units across; u goes around, v pole to pole.
+
+    Only insets drawn smaller than full size lose detail; anything else keeps
+    `full_resolution` (manim's default when None).
+    """
+    if screen_radius >= full_radius:
+        return full_resolution
+    pixel_width = config.pixel_width if pixel_width is None else pixel_width
+    radius_px = screen_radius * pixel_width / config.frame_width
+    v = math.ceil(PI * radius_px / PIXELS_PER_FACET)
+    v = min(max(v, MIN_RESOLUTION[1]), MAX_INSET_RESOLUTION[1])
+    return (2 * v, v)
+
+
+def cached_sphere(radius=1, resolution=None):
+    """A fresh copy of the unstyled Sphere tessellated at `resolution` (manim's default when None)"""
+    key = (radius, resolution)
+    if key not in _MESHES:
+        _MESHES[key] = Sphere(radius=radius, resolution=resolution)
+    return _MESHES[key].copy()
+
+
+def lod_sphere(radius=1, screen_radius=None, full_resolution=None):
+    """Cached sphere tessellated for its on-screen size (full_resolution unless it will be scaled down)"""
+    screen_radius = radius if screen_radius is None else screen_radius
+    return cached_sphere(radius, lod_resolution(screen_radius, radius, full_resolution))
+
+
+def clear_mesh_cache():
+    _MESHES.clear()
@@ -0,0 +1,234 @@
+import numpy as np
+
+# Stabilizer (Clifford tableau) simulation, after Aaronson & Gottesman's CHP.
+#
+# Every gate the circuit views draw (h, cx, x, z, id, measure) is Clifford, so a
+# register of n qubits can be tracked with a 2n x 2n bit tableau instead of 2^n
+# amplitudes: O(n) per gate, O(n^2) per measurement. Rows 0..n-1 are the
+# destabilizers and rows n..2n-1 the stabilizers.
+# Bit (x, z) = (1, 1) stands for Y. Qubit indices match the statevector engine.
+
+CLIFFORD_GATES = {"id", "x", "y", "z", "h", "s", "sdg", "cx", "cz", "swap", "measure", "barrier"}
+
+
+def _product_exponent(x1, z1, x2, z2):
+    """Power of i picked up per qubit when multiplying Pauli (x1, z1) by (x2, z2)"""
+    z2_int, x2_int = z2.astype(int), x2.astype(int)
+    return np.where(
+        x1 & z1, z2_int - x2_int,
+        np.where(x1, z2_int * (2 * x2_int - 1), np.where(z1, x2_int * (1 - 2 * z2_int), 0))
+    )
+
+
+def _phase_flip(exponents):
+    """Sign bit picked up from the i-powers of a product; a product of commuting Paulis only ever picks up +-1"""
+    return (np.sum(exponents, axis=-1) % 4) == 2
+
+
+def _product_phase(xs, zs):
+    """Sign bit picked up multiplying the Pauli rows (xs, zs) together, ignoring their own signs"""
+    # The Pauli part of a running product is just a running XOR; shift it to get the product before each row
+    prev_x = np.zeros_like(xs)
+    prev_z = np.zeros_like(zs)
+    prev_x[1:] = np.logical_xor.accumulate(xs, axis=0)[:-1]
+    prev_z[1:] = np.logical_xor.accumulate(zs, axis=0)[:-1]
+    return bool(_phase_flip(_product_exponent(xs, zs, prev_x, prev_z).ravel()))
+
+
+def _rowsum_phase(x_h, z_h, r_h, x_i, z_i, r_i):
+    """Sign bit of (row i) * (row h); rows may be stacked along the first axis"""
+    total = 2 * r_h.astype(int) + 2 * int(r_i) + _product_exponent(x_i, z_i, x_h, z_h).sum(axis=-1)
+    return (total % 4) == 2
+
+
+class Tableau:
+    def __init__(self, num_qubits, seed=None):
+        n = num_qubits
+        self.num_qubits = n
+        self.x = np.zeros((2 * n, n), dtype=bool)
+        self.z = np.zeros((2 * n, n), dtype=bool)
+        self.r = np.zeros(2 * n, dtype=bool)
+        self.x[np.arange(n), np.arange(n)] = True  # destabilizers X_i
+        self.z[np.arange(n) + n, np.arange(n)] = True  # stabilizers Z_i, i.e. |00...0>
+        # Outcomes are drawn from (seed, measurement count), so replaying the same gates replays the same outcomes
+        self.seed = int(np.random.SeedSequence().entropy % 2 ** 32) if seed is None else seed
+        self.measurements = []  # (qubit, clbit, outcome) in the order they happened
+
+    def copy(self):
+        other = Tableau.__new__(Tableau)
+        other.num_qubits = self.num_qubits
+        other.x = self.x.copy()
+        other.z = self.z.copy()
+        other.r = self.r.copy()
+        other.seed = self.seed
+        other.measurements = list(self.measurements)
+        return other
+
+    # === Gates (each updates every row at once) ===
+
+    def h(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+
+    def sdg(self, a):
+        for _ in range(3):
+            self.s(a)
+
+    def x_gate(self, a):
+        self.r ^= self.z[:, a]
+
+    def y_gate(self, a):
+        self.r ^= self.x[:, a] ^ self.z[:, a]
+
+    def z_gate(self, a):
+        self.r ^= self.x[:, a]
+
+    def cx(self, a, b):
+        self.r ^= self.x[:, a] & self.z[:, b] & ~(self.x[:, b] ^ self.z[:, a])
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+
+    def cz(self, a, b):
+        self.h(b)
+        self.cx(a, b)
+        self.h(b)
+
+    def swap(self, a, b):
+        self.cx(a, b)
+        self.cx(b, a)
+        self.cx(a, b)
+
+    def apply(self, name, qubits):
+        """Applies a named Clifford gate in place"""
+        if name in ("id", "barrier"):
+            return
+        single = {"h": self.h, "s": self.s, "sdg": self.sdg, "x": self.x_gate, "y": self.y_gate, "z": self.z_gate}
+        double = {"cx": self.cx, "cz": self.cz, "swap": self.swap}
+        if name in single:
+            single[name](qubits[0])
+        elif name in double:
+            double[name](qubits[0], qubits[1])
+        else:
+            raise ValueError(f"Gate '{name}' is not a Clifford gate the stabilizer backend supports!")
+
+    # === Measurement ===
+
+    def _product_sign(self, rows):
+        """Sign bit of the product of the given rows, for all of them at once rather than one rowsum at a time"""
+        if len(rows) == 0:
+            return False
+        return bool(self.r[rows].sum() % 2) ^ _product_phase(self.x[rows], self.z[rows])
+
+    def is_deterministic(self, a):
+        """True when measuring qubit a in the Z basis has a fixed outcome"""
+        n = self.num_qubits
+        return not self.x[n:2 * n, a].any()
+
+    def measure(self, a, rng=None, clbit=None):
+        """Measures qubit a in the Z basis, collapsing the tableau, and returns the outcome bit"""
+        n = self.num_qubits
+        hits = np.flatnonzero(self.x[n:2 * n, a])
+        if len(hits) == 0:
+            # Deterministic: Z_a is (up to sign) the product of the stabilizers whose destabilizers anticommute with it
+            outcome = int(self._product_sign(np.flatnonzero(self.x[:n, a]) + n))
+        else:
+            if rng is None:
+                rng = np.random.default_rng([self.seed, len(self.measurements)])
+            p = hits[0] + n
+            # Every other row that anticommutes with Z_a gets multiplied by row p, all at once
+            rows = np.flatnonzero(self.x[:, a])
+            rows = rows[rows != p]
+            self.r[rows] = _rowsum_phase(self.x[rows], self.z[rows], self.r[rows], self.x[p], self.z[p], self.r[p])
+            self.x[rows] ^= self.x[p]
+            self.z[rows] ^= self.z[p]
+            # Row p becomes the new stabilizer +-Z_a, and its old value the matching destabilizer
+            self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+            self.x[p] = False
+            self.z[p] = False
+            self.z[p, a] = True
+            outcome = int(rng.integers(2))
+            self.r[p] = bool(outcome)
+        self.measurements.append((a, clbit, outcome))
+        return outcome
+
+    def measurement_map(self, qubits):
+        """Outcomes of measuring `qubits` in turn, as an affine map of independent fair coin flips.
+
+        Returns (base, generators): a shot is base ^ (coins @ generators % 2) for k uniformly
+        random coins, where k = len(generators) is the number of non-deterministic outcomes.
+        The tableau itself is left untouched.
+        """
+        n, m = self.num_qubits, len(qubits)
+        x, z = self.x.copy(), self.z.copy()
+        # Sign bits as affine functions: column 0 is the constant term, column j the j-th coin
+        signs = np.zeros((2 * n, m + 1), dtype=bool)
+        signs[:, 0] = self.r
+        outcomes = np.zeros((m, m + 1), dtype=bool)
+        coins = 0
+
+        for i, a in enumerate(qubits):
+            hits = np.flatnonzero(x[n:2 * n, a])
+            if len(hits) == 0:
+                # Same product as in measure(), with the stabilizer signs XOR-ed symbolically
+                rows = np.flatnonzero(x[:n, a]) + n
+                outcomes[i] = np.logical_xor.reduce(signs[rows], axis=0)
+                if len(rows):
+                    outcomes[i, 0] ^= _product_phase(x[rows], z[rows])
+                continue
+
+            p = hits[0] + n
+            rows = np.flatnonzero(x[:, a])
+            rows = rows[rows != p]
+            signs[rows] ^= signs[p]
+            signs[rows, 0] ^= _phase_flip(_product_exponent(x[p], z[p], x[rows], z[rows]))
+            x[rows] ^= x[p]
+            z[rows] ^= z[p]
+            x[p - n], z[p - n], signs[p - n] = x[p], z[p], signs[p]
+            x[p] = False
+            z[p] = False
+            z[p, a] = True
+            coins += 1
+            signs[p] = False
+            signs[p, coins] = True
+            outcomes[i] = signs[p]
+
+        return outcomes[:, 0], outcomes[:, 1:coins + 1].T
+
+    # === Expectation values ===
+
+    def bloch_vectors(self):
+        """Per-qubit Bloch vectors, shape (n, 3); every entry is -1, 0 or +1 for a stabilizer state"""
+        n = self.num_qubits
+        stab_x, stab_z = self.x[n:2 * n], self.z[n:2 * n]
+        # A single-qubit Pauli has a nonzero expectation only if it commutes with every stabilizer
+        commutes = np.stack([
+            ~stab_z.any(axis=0),  # X_a
+            ~(stab_x ^ stab_z).any(axis=0),  # Y_a
+            ~stab_x.any(axis=0),  # Z_a
+        ], axis=1)
+
+        # Rows whose destabilizer anticommutes with each Pauli, i.e. the stabilizers that multiply to it
+        destab_x, destab_z = self.x[:n], self.z[:n]
+        anticommuting = (destab_z, destab_x ^ destab_z, destab_x)
+
+        vectors = np.zeros((n, 3))
+        for a, axis in zip(*np.nonzero(commutes)):
+            rows = np.flatnonzero(anticommuting[axis][:, a]) + n
+            vectors[a, axis] = -1 if self._product_sign(rows) else 1
+        return vectors
+
+    def outcomes(self, num_clbits):
+        """Classical register after the recorded measurements, as a list of bits (unset bits are 0)"""
+        bits = [0] * num_clbits
+        for _, clbit, outcome in self.measurements:
+            if clbit is not None:
+                bits[clbit] = outcome
+        return bits
+
+
+def is_clifford_circuit(instructions):
+    return all(name in CLIFFORD_GATES for name, *_ in instructions)
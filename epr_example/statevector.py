@@ -0,0 +1,192 @@
+import numpy as np
+
+# Matrix-free statevector engine.
+#
+# States are flat complex arrays of length 2^n. Qubit 0 is the most significant
+# bit (|q0 q1 ... q_{n-1}>), the same ordering used by old/gates_def.py and by the
+# hand-written vector views (H on q_0 of |00> gives |00> + |10>). Reshaping a
+# state to (2,) * n puts qubit i on axis i, so every gate is a tensordot over
+# one or two axes: O(2^n) work instead of building a 2^n x 2^n matrix.
+
+SQRT2_INV = 1 / np.sqrt(2)
+
+I = np.eye(2, dtype=complex)
+X = np.array([[0, 1], [1, 0]], dtype=complex)
+Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+Z = np.array([[1, 0], [0, -1]], dtype=complex)
+H = np.array([[1, 1], [1, -1]], dtype=complex) * SQRT2_INV
+S = np.array([[1, 0], [0, 1j]], dtype=complex)
+T = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+
+CX = np.array([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+    [0, 0, 1, 0],
+], dtype=complex)
+CZ = np.diag([1, 1, 1, -1]).astype(complex)
+SWAP = np.array([
+    [1, 0, 0, 0],
+    [0, 0, 1, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+], dtype=complex)
+
+
+def controlled(matrix, num_controls=1):
+    """Controlled version of a gate, controls first (as qiskit orders cx, ccx, crz, ...)"""
+    size = 2 ** num_controls * len(matrix)
+    gate = np.eye(size, dtype=complex)
+    gate[size - len(matrix):, size - len(matrix):] = matrix
+    return gate
+
+
+# Fixed gates, keyed by qiskit instruction name
+GATES = {
+    "id": I,
+    "x": X,
+    "y": Y,
+    "z": Z,
+    "h": H,
+    "s": S,
+    "sdg": S.conj().T,
+    "t": T,
+    "tdg": T.conj().T,
+    "cx": CX,
+    "cy": controlled(Y),
+    "cz": CZ,
+    "ch": controlled(H),
+    "swap": SWAP,
+    "ccx": controlled(X, 2),
+    "cswap": controlled(SWAP),
+}
+
+# Instructions that leave the statevector untouched when drawn step by step
+NON_UNITARY = {"measure", "barrier", "delay"}
+
+
+def rx(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+
+
+def ry(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=complex)
+
+
+def rz(theta):
+    return np.diag([np.exp(-1j * theta / 2), np.exp(1j * theta / 2)])
+
+
+def phase(lam):
+    return np.diag([1, np.exp(1j * lam)]).astype(complex)
+
+
+def u(theta, phi, lam):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([
+        [c, -np.exp(1j * lam) * s],
+        [np.exp(1j * phi) * s, np.exp(1j * (phi + lam)) * c],
+    ], dtype=complex)
+
+
+PARAMETRIC_GATES = {
+    "rx": rx,
+    "ry": ry,
+    "rz": rz,
+    "p": phase,
+    "u": u,
+    "crx": lambda theta: controlled(rx(theta)),
+    "cry": lambda theta: controlled(ry(theta)),
+    "crz": lambda theta: controlled(rz(theta)),
+    "cp": lambda lam: controlled(phase(lam)),
+}
+
+
+def gate_matrix(name, params=()):
+    """Returns the matrix of the named gate, 2^k x 2^k for a k-qubit gate"""
+    if name in GATES:
+        return GATES[name]
+    if name in PARAMETRIC_GATES:
+        return PARAMETRIC_GATES[name](*[float(p) for p in params])
+    raise ValueError(f"Gate '{name}' is not supported by the statevector engine!")
+
+
+def num_qubits_of(state):
+    n = int(np.log2(state.shape[-1]))
+    if 2 ** n != state.shape[-1]:
+        raise ValueError(f"State of length {state.shape[-1]} is not a qubit register.")
+    return n
+
+
+def zero_state(n):
+    """Returns |00...0> for n qubits"""
+    state = np.zeros(2 ** n, dtype=complex)
+    state[0] = 1
+    return state
+
+
+def basis_state(bits):
+    """Returns the computational basis state for a bitstring like "010" (q0 first)"""
+    state = np.zeros(2 ** len(bits), dtype=complex)
+    state[int(bits, 2)] = 1
+    return state
+
+
+def apply_gate(state, matrix, qubits):
+    """Applies a k-qubit matrix to the given qubits of a statevector, without building the full operator"""
+    n = num_qubits_of(state)
+    qubits = list(qubits)
+    k = len(qubits)
+    psi = np.asarray(state, dtype=complex).reshape((2,) * n)
+    gate = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k))
+
+    # Contract the gate's input axes with the target axes, then put the output axes back in place
+    psi = np.tensordot(gate, psi, axes=(list(range(k, 2 * k)), qubits))
+    psi = np.moveaxis(psi, list(range(k)), qubits)
+    return psi.reshape(-1)
+
+
+def _flip(state, target, control=None):
+    """X on target (optionally controlled) done as an axis flip, with no arithmetic at all"""
+    n = num_qubits_of(state)
+    psi = np.array(state, dtype=complex).reshape((2,) * n)
+    index = [slice(None)] * n
+    if control is not None:
+        index[control] = 1
+    sub = psi[tuple(index)]
+    axis = target if control is None or target < control else target - 1
+    psi[tuple(index)] = np.flip(sub, axis=axis)
+    return psi.reshape(-1)
+
+
+def hadamard(state, target=None):
+    """Applies H to one qubit, or to every qubit when target is None"""
+    targets = range(num_qubits_of(state)) if target is None else [target]
+    for q in targets:
+        state = apply_gate(state, H, [q])
+    return state
+
+
+def not_gate(state, target):
+    """Applies the NOT (Pauli-X) gate to the target qubit (0-indexed)"""
+    return _flip(state, target)
+
+
+def cnot(state, control, target):
+    """Applies CNOT where 'control' and 'target' are qubit indices (0-indexed)"""
+    if control == target:
+        raise ValueError("CNOT control and target must be different qubits.")
+    return _flip(state, target, control)
+
+
+def apply_instruction(state, name, qubits, params=()):
+    """Applies a qiskit-style instruction (name, qubit indices, params) to a statevector"""
+    if name in NON_UNITARY:
+        return state
+    if name == "x":
+        return not_gate(state, qubits[0])
+    if name == "cx":
+        return cnot(state, qubits[0], qubits[1])
+    return apply_gate(state, gate_matrix(name, params), qubits)
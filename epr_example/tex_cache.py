@@ -0,0 +1,242 @@
+import manim
+from manim import config, TexTemplate, VGroup, VectorizedPoint, RIGHT
+import numpy as np
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Persistent cache of compiled Tex / MathTex / Text mobjects.
+#
+# manim already keeps the SVG that LaTeX produces under media/Tex, but every
+# run still re-reads and re-parses that SVG into Bezier paths. Here the parsed
+# mobject itself (its submobject tree, point data and style) is stored under a
+# content hash of everything that shapes it: class, tex strings, template,
+# font size and the remaining keyword arguments. A warm run loads the pickle
+# and touches neither LaTeX nor the SVG parser. Text gets the same treatment,
+# which skips the Pango layout and its SVG.
+#
+# Tex, MathTex and Text below are drop-in replacements for manim's; import
+# them after `from manim import *` so they shadow the originals. Counters whose
+# number changes every step ("t = 3") are better served by CounterText, which
+# lays out its digits once and then only copies glyphs.
+#
+# precompile_tex() fills the cache before a scene's construct runs (scenes
+# get it by mixing in PrecompiledTexScene): it reads
+# the scene's source, collects every Tex/MathTex call whose arguments can be
+# worked out without running the scene (literals, module-level names and
+# simple local aliases of them) and compiles the missing ones across a
+# process pool, so LaTeX and dvisvgm launches overlap instead of queueing one
+# after another inside construct. Calls it can't resolve (f-strings of loop
+# variables, ...) just compile lazily as before.
+
+_MEMORY = {}
+
+# The braket preamble most scenes share, so their strings hash (and cache) alike
+BRAKET_TEMPLATE = TexTemplate()
+BRAKET_TEMPLATE.add_to_preamble(r"\usepackage{braket}")
+
+# Expression nodes that can be evaluated ahead of time without side effects
+_SAFE_NODES = (ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Attribute, ast.Tuple, ast.List, ast.Dict,
+               ast.BinOp, ast.Add, ast.Mult, ast.Mod, ast.UnaryOp, ast.USub, ast.JoinedStr, ast.FormattedValue)
+
+
+def tex_cache_dir():
+    return Path(config.get_dir("tex_dir")) / "mobjects"
+
+
+def tex_key(cls, tex_strings, kwargs):
+    """Content hash of everything that shapes a compiled Tex (or Text) mobject"""
+    template = (kwargs.get("tex_template") or config.tex_template) if issubclass(cls, manim.MathTex) else None
+    rest = {k: v for k, v in kwargs.items() if k != "tex_template"}
+    material = repr((
+        manim.__version__,
+        cls.__name__,
+        tex_strings,
+        getattr(template, "body", repr(template)),
+        sorted((k, repr(v)) for k, v in rest.items()),
+    ))
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+def _load(path):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or from an incompatible manim: rebuild and overwrite
+        return None
+
+
+def _store(path, mob):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(mob, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)  # atomic, so a parallel render never sees half a file
+    except Exception:
+        # Not picklable (e.g. a lambda in the kwargs): keep it in memory only
+        tmp.unlink(missing_ok=True)
+
+
+def cached_tex_mobject(cls, *tex_strings, **kwargs):
+    """Fresh copy of cls(*tex_strings, **kwargs), compiled at most once across runs"""
+    key = tex_key(cls, tex_strings, kwargs)
+    if key not in _MEMORY:
+        path = tex_cache_dir() / f"{key}.pkl"
+        mob = _load(path)
+        if mob is None:
+            mob = cls(*tex_strings, **kwargs)
+            _store(path, mob)
+        _MEMORY[key] = mob
+    return _MEMORY[key].copy()
+
+
+def Tex(*tex_strings, **kwargs):
+    return cached_tex_mobject(manim.Tex, *tex_strings, **kwargs)
+
+
+def MathTex(*tex_strings, **kwargs):
+    return cached_tex_mobject(manim.MathTex, *tex_strings, **kwargs)
+
+
+def Text(text, **kwargs):
+    return cached_tex_mobject(manim.Text, text, **kwargs)
+
+
+class CounterText(VGroup):
+    """Text like "t = 3" around a non-negative integer that set_value swaps by copying cached digit glyphs"""
+
+    def __init__(self, template="{}", value=0, **text_kwargs):
+        super().__init__()
+        text_kwargs.setdefault("disable_ligatures", True)  # keep one submobject per character
+        prefix, suffix = template.split("{}")
+        # One layout with a 0 in the number's place fixes the prefix, the suffix and the baseline...
+        reference = Text(prefix + "0" + suffix, **text_kwargs)
+        split = len("".join(prefix.split()))  # Text has one submobject per visible character
+        zero = reference[split]
+        # ...and one of all ten digits gives the glyphs and the digit advance (digits are tabular)
+        atlas = Text("0123456789", **text_kwargs)
+        self.pitch = (atlas[9].get_center()[0] - atlas[0].get_center()[0]) / 9
+        # Each glyph moved from its own cell in the atlas into the first digit slot
+        offset = zero.get_center() - atlas[0].get_center()
+        self.glyphs = [glyph.copy().shift(offset - d * self.pitch * RIGHT) for d, glyph in enumerate(atlas)]
+        # Two invisible points mark the first two slots, so set_value works wherever the counter is moved or scaled to
+        self.slots = VGroup(VectorizedPoint(self.glyphs[0].get_center()),
+                            VectorizedPoint(self.glyphs[0].get_center() + self.pitch * RIGHT))
+        self.prefix = VGroup(*reference[:split])
+        self.digits = VGroup(zero)
+        self.suffix = VGroup(*reference[split + 1:])
+        self.add(self.prefix, self.digits, self.suffix, self.slots)
+        self.value = 0
+        self.set_value(value)
+
+    def set_value(self, value):
+        value = int(value)
+        if value < 0:
+            raise ValueError(f"CounterText shows non-negative integers, got {value}")
+        first, second = (slot.get_center() for slot in self.slots)
+        pitch = second - first
+        factor = np.linalg.norm(pitch) / self.pitch
+        old_length, text = len(self.digits), str(value)
+        digits = []
+        for j, c in enumerate(text):
+            glyph = self.glyphs[int(c)]
+            digit = glyph.copy().scale(factor).move_to(first + j * pitch + factor * (glyph.get_center() - self.glyphs[0].get_center()))
+            digits.append(digit.match_style(self.digits[0]))
+        self.digits.remove(*self.digits)
+        self.digits.add(*digits)
+        self.suffix.shift((len(text) - old_length) * pitch)
+        self.value = value
+        return self
+
+
+def _safe_eval(node, namespace):
+    """Value of an expression node if it is side-effect free and all its names are known, else raises"""
+    tree = ast.Expression(node)
+    if not all(isinstance(n, _SAFE_NODES) for n in ast.walk(tree)):
+        raise ValueError("not a plain expression")
+    return eval(compile(tree, "<tex>", "eval"), dict(namespace))
+
+
+def collect_tex_specs(obj):
+    """(class name, tex strings, kwargs) of every Tex/MathTex call in obj's source that can be resolved statically"""
+    module = inspect.getmodule(obj)
+    # Parse the whole module (dedenting a method's source would change its triple-quoted strings)
+    tree = ast.parse(inspect.getsource(module))
+    if obj is not module:
+        line = inspect.getsourcelines(obj)[1]
+        tree = next(n for n in ast.walk(tree) if isinstance(n, (ast.ClassDef, ast.FunctionDef)) and
+                    min([n.lineno] + [d.lineno for d in n.decorator_list]) == line)
+    specs = []
+    for function in [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]:
+        namespace = dict(vars(module))
+        # Walk the body in source order so local aliases (tex_template = BRAKET_TEMPLATE) are known when used
+        for node in sorted(ast.walk(function), key=lambda n: (getattr(n, "lineno", 0), getattr(n, "col_offset", 0))):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                try:
+                    namespace[node.targets[0].id] = _safe_eval(node.value, namespace)
+                except Exception:
+                    namespace.pop(node.targets[0].id, None)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("Tex", "MathTex"):
+                try:
+                    strings = tuple(_safe_eval(arg, namespace) for arg in node.args)
+                    kwargs = {kw.arg: _safe_eval(kw.value, namespace) for kw in node.keywords}
+                except Exception:
+                    continue
+                if None not in kwargs and all(isinstance(s, str) for s in strings):
+                    specs.append((node.func.id, strings, kwargs))
+    return specs
+
+
+def _compile_spec(spec):
+    """Process pool worker: compile one spec into the disk cache"""
+    media_dir, class_name, strings, kwargs = spec
+    config.media_dir = media_dir
+    cached_tex_mobject(getattr(manim, class_name), *strings, **kwargs)
+
+
+def precompile_tex(*sources, processes=None):
+    """Fills the Tex cache with every statically known Tex/MathTex of the given classes, functions or modules"""
+    pending, seen = [], set()
+    for source in sources:
+        for class_name, strings, kwargs in collect_tex_specs(source):
+            key = tex_key(getattr(manim, class_name), strings, kwargs)
+            if key in seen or key in _MEMORY:
+                continue
+            seen.add(key)
+            if not (tex_cache_dir() / f"{key}.pkl").exists():
+                pending.append((class_name, strings, kwargs))
+    jobs = [(config.media_dir, *spec) for spec in pending]
+    processes = processes or os.cpu_count() or 1
+    if len(jobs) > 1 and processes > 1:
+        with ProcessPoolExecutor(min(processes, len(jobs))) as pool:
+            list(pool.map(_compile_spec, jobs))
+    else:
+        for job in jobs:
+            _compile_spec(job)
+    return len(jobs)
+
+
+class PrecompiledTexScene:
+    """Scene mixin that runs precompile_tex() in setup, over the scene's classes and any extra tex_sources"""
+
+    tex_sources = ()  # other classes, functions or modules whose Tex the scene builds
+
+    def setup(self):
+        super().setup()
+        scene_classes = [cls for cls in type(self).__mro__ if issubclass(cls, PrecompiledTexScene) and cls is not PrecompiledTexScene]
+        precompile_tex(*scene_classes, *self.tex_sources)
+
+
+def clear_tex_cache(disk=False):
+    _MEMORY.clear()
+    if disk:
+        for path in tex_cache_dir().glob("*.pkl"):
+            path.unlink()
@@ -0,0 +1,270 @@
+import math
+from collections import OrderedDict
+import numpy as np
+from epr_example.statevector import zero_state, apply_instruction
+from epr_example.reduced_states import bloch_vectors
+from epr_example.stabilizer import Tableau, is_clifford_circuit
+from epr_example import mps
+
+# Per-timestep state trajectories for qiskit circuits.
+#
+# Step t holds the state after the first t instructions of qc.data (step 0 is
+# |00...0>), matching the `t` used by Circuit.construct. Each step is computed
+# from the previous one, and trajectories are cached (least recently used out)
+# by circuit content and backend settings so the circuit, vector and Bloch
+# views of a scene share a single simulation pass.
+# The state itself comes from a backend: a dense statevector by default, or a
+# stabilizer tableau for Clifford circuits wider than a statevector can hold, or
+# a matrix product state for wide circuits that stay weakly entangled.
+
+# Beyond this many qubits, "auto" picks the stabilizer (Clifford) or MPS backend
+MAX_STATEVECTOR_QUBITS = 24
+
+# Roughly how many bytes of states a single trajectory may keep around
+TRAJECTORY_MEMORY_BUDGET = 256 * 2 ** 20
+
+# How many trajectories the cache keeps; the least recently used one goes first
+MAX_CACHED_TRAJECTORIES = 32
+
+
+def _param_key(param):
+    try:
+        return float(param)
+    except TypeError:
+        return str(param)
+
+
+def circuit_instructions(qc):
+    """Returns qc.data as a tuple of (name, qubit indices, clbit indices, params)"""
+    instructions = []
+    for instruction in qc.data:
+        op = instruction.operation
+        qubits = tuple(qc.find_bit(q).index for q in instruction.qubits)
+        clbits = tuple(qc.find_bit(c).index for c in instruction.clbits)
+        params = tuple(_param_key(p) for p in op.params)
+        instructions.append((op.name, qubits, clbits, params))
+    return tuple(instructions)
+
+
+def circuit_key(qc):
+    """Hashable key describing a circuit's content (not its identity)"""
+    return (qc.num_qubits, qc.num_clbits, circuit_instructions(qc))
+
+
+class StatevectorBackend:
+    name = "statevector"
+
+    @property
+    def cache_key(self):
+        """Everything about the backend that changes the states it produces"""
+        return (self.name,)
+
+    def initial_state(self, num_qubits):
+        return zero_state(num_qubits)
+
+    def apply(self, state, name, qubits, clbits, params):
+        return apply_instruction(state, name, qubits, params)
+
+    def state_nbytes(self, num_qubits):
+        return 16 * 2 ** num_qubits
+
+    def bloch_vectors(self, state):
+        return bloch_vectors(state)
+
+
+class StabilizerBackend:
+    """Clifford-only backend for registers far too wide for a statevector; measurements collapse the state"""
+    name = "stabilizer"
+
+    def __init__(self, seed=None):
+        self.seed = seed
+
+    @property
+    def cache_key(self):
+        return (self.name, self.seed)
+
+    def initial_state(self, num_qubits):
+        return Tableau(num_qubits, seed=self.seed)
+
+    def apply(self, state, name, qubits, clbits, params):
+        state = state.copy()
+        if name == "measure":
+            state.measure(qubits[0], clbit=clbits[0] if clbits else None)
+        else:
+            state.apply(name, qubits)
+        return state
+
+    def state_nbytes(self, num_qubits):
+        return 2 * num_qubits * (2 * num_qubits + 1)
+
+    def bloch_vectors(self, state):
+        return state.bloch_vectors()
+
+
+class MPSBackend:
+    """Bond-dimension-capped MPS backend; see MPS.truncation_error for how much was thrown away"""
+    name = "mps"
+
+    def __init__(self, max_bond=mps.DEFAULT_MAX_BOND):
+        self.max_bond = max_bond
+
+    @property
+    def cache_key(self):
+        return (self.name, self.max_bond)
+
+    def initial_state(self, num_qubits):
+        return mps.MPS.zero_state(num_qubits, self.max_bond)
+
+    def apply(self, state, name, qubits, clbits, params):
+        return mps.apply_instruction(state, name, qubits, params)
+
+    def state_nbytes(self, num_qubits):
+        return 16 * 2 * num_qubits * self.max_bond ** 2
+
+    def bloch_vectors(self, state):
+        return state.bloch_vectors()
+
+
+BACKENDS = {
+    "statevector": StatevectorBackend(),
+    "stabilizer": StabilizerBackend(),
+    "mps": MPSBackend(),
+}
+
+
+class StateTrajectory:
+    def __init__(self, num_qubits, instructions, backend="statevector", prefix_states=None):
+        self.num_qubits = num_qubits
+        self.instructions = tuple(instructions)
+        self.backend = BACKENDS[backend] if isinstance(backend, str) else backend
+
+        # Keep every state if the whole trajectory fits the memory budget, otherwise only
+        # every k-th one; steps in between are replayed from the checkpoint before them
+        state_bytes = self.backend.state_nbytes(num_qubits)
+        self.checkpoint_interval = max(1, math.ceil(len(self) * state_bytes / TRAJECTORY_MEMORY_BUDGET))
+
+        # States are never modified in place, so a cached prefix can be shared as-is
+        self._states = dict(prefix_states) if prefix_states else {0: self.backend.initial_state(num_qubits)}
+        self._frontier = max(self._states)
+        self._recent = None  # (t, state) of the last replayed step, so iterating past checkpoints stays O(1) per step
+
+    def __len__(self):
+        """Number of time steps, including the initial state"""
+        return len(self.instructions) + 1
+
+    @property
+    def num_computed(self):
+        return self._frontier + 1
+
+    def _step(self, t, state):
+        """State at step t + 1 given the state at step t"""
+        name, qubits, clbits, params = self.instructions[t]
+        return self.backend.apply(state, name, qubits, clbits, params)
+
+    def _advance(self):
+        state = self._step(self._frontier, self._states[self._frontier])
+        if self._frontier % self.checkpoint_interval:
+            del self._states[self._frontier]
+        self._frontier += 1
+        self._states[self._frontier] = state
+
+    def _replay(self, t):
+        start = max(step for step in self._states if step <= t)
+        state = self._states[start]
+        if self._recent is not None and start <= self._recent[0] <= t:
+            start, state = self._recent
+        for step in range(start, t):
+            state = self._step(step, state)
+        self._recent = (t, state)
+        return state
+
+    def state(self, t):
+        """State after the first t instructions, simulating only the steps not yet computed"""
+        if not -len(self) <= t < len(self):
+            raise IndexError(f"Time step {t} is out of range for a circuit with {len(self) - 1} instructions.")
+        t %= len(self)
+        while self._frontier < t:
+            self._advance()
+        if t in self._states:
+            return self._states[t]
+        return self._replay(t)
+
+    def __getitem__(self, t):
+        return self.state(t)
+
+    def __iter__(self):
+        """Streams states step by step, computing each one from the previous step"""
+        for t in range(len(self)):
+            yield self.state(t)
+
+    @property
+    def states(self):
+        """All states stacked into one (steps, 2^n) array (statevector backend)"""
+        return np.stack(list(self))
+
+    def bloch_vectors(self, t=None):
+        """Per-qubit Bloch vectors of step t, shape (n, 3), or of every step, shape (steps, n, 3)"""
+        if t is not None:
+            return self.backend.bloch_vectors(self.state(t))
+        return np.stack([self.backend.bloch_vectors(state) for state in self])
+
+    def shared_states(self, length):
+        """The kept states among the first `length` steps, for seeding a trajectory with the same prefix"""
+        return {t: state for t, state in self._states.items() if t < length}
+
+    def extend(self, instructions):
+        """Returns the trajectory of this circuit with more instructions appended, reusing every computed step"""
+        return StateTrajectory(self.num_qubits, self.instructions + tuple(instructions), self.backend, self._states)
+
+
+_TRAJECTORY_CACHE = OrderedDict()
+
+
+def _common_prefix_length(a, b):
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+def _reusable_states(backend_key, num_qubits, instructions):
+    """Already-simulated states of the cached trajectory sharing the longest prefix with these instructions"""
+    best = {}
+    for (key, n, _, cached), trajectory in _TRAJECTORY_CACHE.items():
+        if key != backend_key or n != num_qubits:
+            continue
+        shared = trajectory.shared_states(_common_prefix_length(cached, instructions) + 1)
+        if max(shared) > max(best, default=-1):
+            best = shared
+    return best
+
+
+def get_trajectory(qc, backend="statevector"):
+    """Returns the (lazily simulated) trajectory of qc, shared with any view that asks for the same circuit"""
+    num_qubits, num_clbits, instructions = circuit_key(qc)
+    if backend == "auto":
+        if num_qubits <= MAX_STATEVECTOR_QUBITS:
+            backend = "statevector"
+        else:
+            backend = "stabilizer" if is_clifford_circuit(instructions) else "mps"
+    backend_obj = BACKENDS[backend] if isinstance(backend, str) else backend
+    # Backends with different settings (MPS bond caps, stabilizer seeds) produce different states
+    key = (backend_obj.cache_key, num_qubits, num_clbits, instructions)
+
+    trajectory = _TRAJECTORY_CACHE.get(key)
+    if trajectory is None:
+        # Only the steps past the longest cached common prefix will ever be simulated
+        prefix_states = _reusable_states(backend_obj.cache_key, num_qubits, instructions)
+        trajectory = StateTrajectory(num_qubits, instructions, backend_obj, prefix_states)
+        _TRAJECTORY_CACHE[key] = trajectory
+        if len(_TRAJECTORY_CACHE) > MAX_CACHED_TRAJECTORIES:
+            _TRAJECTORY_CACHE.popitem(last=False)
+    else:
+        _TRAJECTORY_CACHE.move_to_end(key)
+    return trajectory
+
+
+def clear_trajectory_cache():
+    _TRAJECTORY_CACHE.clear()
@@ -0,0 +1,66 @@
+import numpy as np
+from epr_example.statevector import gate_matrix, NON_UNITARY
+from epr_example.reduced_states import bloch_vectors
+from epr_example.batch import apply_gate_batch
+from epr_example.trajectory import StateTrajectory, get_trajectory
+
+# Cumulative unitaries U_t = G_t ... G_1 for every prefix of a circuit.
+#
+# A unitary is evolved like a batch of 2^n statevectors, one per column, so
+# each gate costs O(4^n) on top of the previous prefix rather than a fresh
+# product of full matrices. The prefixes live in a StateTrajectory, which
+# brings the per-circuit cache, checkpointing for wide registers and O(one
+# gate) extension when a gate is appended. Qubit order is the statevector
+# engine's (qubit 0 most significant), i.e. U = G_{q0} (x) G_{q1} (x) ...
+
+
+class UnitaryBackend:
+    name = "unitary"
+
+    @property
+    def cache_key(self):
+        return (self.name,)
+
+    def initial_state(self, num_qubits):
+        return np.eye(2 ** num_qubits, dtype=complex)
+
+    def apply(self, state, name, qubits, clbits, params):
+        if name in NON_UNITARY:
+            return state
+        # Rows of U^T are the columns of U, i.e. the images of the basis states
+        return apply_gate_batch(state.T, gate_matrix(name, params), qubits).T
+
+    def state_nbytes(self, num_qubits):
+        return 16 * 4 ** num_qubits
+
+    def bloch_vectors(self, state):
+        """Bloch vectors of U|00...0>"""
+        return bloch_vectors(state[:, 0])
+
+
+UNITARY_BACKEND = UnitaryBackend()
+
+
+def get_unitary_trajectory(qc):
+    """Cumulative unitaries of every prefix of qc (measurements and barriers count as identity steps)"""
+    return get_trajectory(qc, UNITARY_BACKEND)
+
+
+def unitary_trajectory(num_qubits, instructions=()):
+    """Uncached cumulative unitaries of an instruction list, for building a circuit up gate by gate with extend()"""
+    return StateTrajectory(num_qubits, instructions, UNITARY_BACKEND)
+
+
+def unitary_block(trajectory, t, rows=None, cols=None):
+    """Sub-block U_t[rows, cols] of the unitary after t instructions (whole rows/columns when None)"""
+    unitary = trajectory.state(t)
+    rows = slice(None) if rows is None else np.asarray(rows)
+    cols = slice(None) if cols is None else np.asarray(cols)
+    if isinstance(rows, np.ndarray) and isinstance(cols, np.ndarray):
+        return unitary[np.ix_(rows, cols)]
+    return unitary[rows][:, cols]
+
+
+def changed_steps(trajectory):
+    """Time steps whose unitary differs from the one before, i.e. the ones worth showing"""
+    return [t + 1 for t, (name, *_) in enumerate(trajectory.instructions) if name not in NON_UNITARY]
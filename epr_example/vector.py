@@ -1,9 +1,9 @@
 from manim import *
+from epr_example.tex_cache import Tex, BRAKET_TEMPLATE, PrecompiledTexScene
 
-class EPRPairMatrixWalkthrough(Scene):
+class EPRPairMatrixWalkthrough(PrecompiledTexScene, Scene):
     def construct(self):
-        tex_template = TexTemplate()
-        tex_template.add_to_preamble(r"\usepackage{braket}")
+        tex_template = BRAKET_TEMPLATE
 
         # Title
         title = Tex(r"EPR Pair Generation – Step-by-Step", font_size=48, tex_template=tex_template)
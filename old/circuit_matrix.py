@@ -1,7 +1,7 @@
 from manim import *
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Operator
 import numpy as np
+from epr_example.unitaries import get_unitary_trajectory, changed_steps
 
 class QuantumCircuitVisualization(Scene):
     def __init__(self, qc=None, **kwargs):
@@ -57,18 +57,17 @@ class QuantumCircuitAndMatrix(Scene):
         self.play(Write(title))
         self.wait(1)
 
-        # Remove measurements before computing the unitary matrix
-        qc_no_measure = QuantumCircuit(self.qc.num_qubits)
-        for instr, qargs, cargs in self.qc.data:
-            if instr.name != "measure":
-                qc_no_measure.append(instr, qargs)
-        unitary = Operator(qc_no_measure).data  # Compute unitary of modified circuit
+        # Cumulative unitary after every gate; measurements leave it unchanged
+        unitaries = get_unitary_trajectory(self.qc)
+        steps = changed_steps(unitaries)
 
-        # Convert unitary matrix to a Manim Matrix object
-        matrix_obj = Matrix(np.round(unitary, 2))
+        # Build the matrix up gate by gate: each step is one cached prefix product
+        matrix_obj = Matrix(np.round(unitaries[0], 2))
         matrix_obj.scale(0.7).next_to(title, DOWN, buff=1)
-        
         self.play(Write(matrix_obj))
+        for t in steps:
+            step_matrix = Matrix(np.round(unitaries[t], 2)).scale(0.7).next_to(title, DOWN, buff=1)
+            self.play(Transform(matrix_obj, step_matrix), run_time=0.8)
         self.wait(2)
 
         self.play(FadeOut(matrix_obj, title))
@@ -2,6 +2,7 @@ from manim import *
 import numpy as np
 import sys
 from typing import List
+from epr_example.bloch_view import BlochSphereView
 
 class Graph3DVisualization(ThreeDScene):
     def __init__(self, num_graphs=3, num_nodes=None, **kwargs):
@@ -118,24 +119,9 @@ class Graph3DVisualization(ThreeDScene):
         self.create_graphs()  # Re-create graphs reflecting the deletion
         self.show_all_graphs()  # Ensure the updated visualization is visible
 
-class BlochSphere(VGroup):
+class BlochSphere(BlochSphereView):
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        
-        sphere = Sphere(radius=1, color=BLUE)
-        sphere.set_opacity(0.5)
-        
-        x_axis = Arrow3D(start=[-1.5, 0, 0], end=[1.5, 0, 0], color=RED)
-        y_axis = Arrow3D(start=[0, -1.5, 0], end=[0, 1.5, 0], color=GREEN)
-        z_axis = Arrow3D(start=[0, 0, -1.5], end=[0, 0, 1.5], color=WHITE)
-        
-        x_label = Tex("X").next_to(x_axis.get_end(), RIGHT)
-        y_label = Tex("Y").next_to(y_axis.get_end(), UP)
-        z_label = Tex("Z").next_to(z_axis.get_end(), OUT)
-        
-        state_vector = Arrow3D(start=[0, 0, 0], end=[0.7, 0.5, 0.5], color=YELLOW)
-        
-        self.add(sphere, x_axis, y_axis, z_axis, x_label, y_label, z_label, state_vector)
+        super().__init__(state_vector_endpoint=[0.7, 0.5, 0.5], sphere_color=BLUE, style="xyz", **kwargs)
 
 if __name__ == "__main__":
     scene = Graph3DVisualization(num_graphs=4, num_nodes=[5, 6, 4, 7])
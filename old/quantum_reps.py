@@ -2,6 +2,7 @@
 from manim import *
 from qiskit import QuantumCircuit
 import numpy as np
+from epr_example.gate_glyphs import GATE_GLYPHS
     
 class QuantumReps(Scene):
     def __init__(self, qc=None, **kwargs):
@@ -16,14 +17,8 @@ class QuantumReps(Scene):
         self.num_qubits = qc.num_qubits
         self.num_clbits = qc.num_clbits
 
-        self.gates_dict = {
-            "id": MathTex(r"I = \begin{bmatrix} 1 & 0 \\ 0 & 1 \end{bmatrix}"),  # Identity Gate
-            "x": MathTex(r"X = \begin{bmatrix} 0 & 1 \\ 1 & 0 \end{bmatrix}"),  # Pauli-X Gate
-            "y": MathTex(r"Y = \begin{bmatrix} 0 & -i \\ i & 0 \end{bmatrix}"),  # Pauli-Y Gate
-            "z": MathTex(r"Z = \begin{bmatrix} 1 & 0 \\ 0 & -1 \end{bmatrix}"),  # Pauli-Z Gate
-            "h": MathTex(r"H = \frac{1}{\sqrt{2}} \begin{bmatrix} 1 & 1 \\ 1 & -1 \end{bmatrix}"),  # Hadamard Gate
-            "cx": MathTex(r"\text{CNOT} = \begin{bmatrix} 1 & 0 & 0 & 0 \\ 0 & 1 & 0 & 0 \\ 0 & 0 & 0 & 1 \\ 0 & 0 & 1 & 0 \end{bmatrix}")  # CNOT Gate
-        }
+        # Gate matrices render on first lookup and are shared with every other scene
+        self.gates_dict = GATE_GLYPHS
 
     def construct(self):
         print(self.qc.draw(output='text'))  # Print circuit for debugging
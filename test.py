@@ -1,5 +1,12 @@
 from manim import *
 import numpy as np
+from epr_example.statevector import I, H, rx
+from epr_example.bloch_rotation import gate_rotation_frames
+from epr_example.bloch_view import BlochSphereView
+from epr_example.noise import (phase_damping_kraus, mixed_unitary_kraus, superoperator, channel_trajectory,
+                               bloch_lengths, density_purities)
+
+MIN_SCALE = 1e-3  # a mobject scaled all the way to zero can't be scaled back
 
 class EPRPairGeneration(ThreeDScene):
     def construct(self):
@@ -19,17 +26,21 @@ class EPRPairGeneration(ThreeDScene):
         self.play(FadeIn(bloch1, bloch2))
         self.wait(1)
 
-        # Show initial states |0>
-        arrow_a = self.add_bloch_vector(bloch1, direction=UP)
-        arrow_b = self.add_bloch_vector(bloch2, direction=UP)
+        # Show initial states |0> (Bloch x, y, z are manim's RIGHT, UP, OUT)
+        arrow_a = self.add_bloch_vector(bloch1, direction=OUT)
+        arrow_b = self.add_bloch_vector(bloch2, direction=OUT)
         self.wait(1)
 
         # Rotate camera slightly for better 3D visibility during state manipulation
         # self.move_camera(phi=65 * DEGREES, theta=-60 * DEGREES, run_time=2)
         # self.wait(1)
 
-        # Apply Hadamard to Qubit A (rotate vector to X axis)
-        self.play(Rotate(arrow_a, angle=-PI/2, axis=RIGHT, about_point=bloch1.get_center()))
+        # Apply Hadamard to Qubit A: a half turn about (X + Z)/sqrt(2), taking |0> to |+> on the X axis
+        h_frame = ValueTracker(0)
+        h_rotations = gate_rotation_frames(H, frames=30)
+        self.follow_rotation(arrow_a, h_rotations, h_frame, about_point=bloch1.get_center())
+        self.play(h_frame.animate.set_value(len(h_rotations) - 1), run_time=1.5)
+        arrow_a.clear_updaters()
         self.wait(1)
 
         # Return camera to original position
@@ -41,18 +52,19 @@ class EPRPairGeneration(ThreeDScene):
         # self.move_camera(phi=60 * DEGREES, theta=-50 * DEGREES, run_time=2)
         # self.wait(1)
 
-        # Shrink only the sphere parts to simulate loss of individual state info
-        shrink_factor = 0.2 # used to be 0.5
-        sphere1, axes1, label1 = bloch1
-        sphere2, axes2, label2 = bloch2
-
-        self.play(
-            sphere1.animate.scale(shrink_factor),
-            sphere2.animate.scale(shrink_factor),
-            arrow_a.animate.scale(0),
-            arrow_b.animate.scale(0),
-            run_time=2
-        )
+        # Shrink only the sphere parts to show the loss of individual state info:
+        # arrows follow each qubit's Bloch vector length, spheres its purity
+        arrow_lengths, sphere_scales = self.entangling_trajectory(frames=60)
+        sphere1, sphere2 = bloch1.sphere, bloch2.sphere
+
+        frame = ValueTracker(0)
+        self.follow_frames(sphere1, sphere_scales[:, 0], frame, about_point=bloch1.get_center())
+        self.follow_frames(sphere2, sphere_scales[:, 1], frame, about_point=bloch2.get_center())
+        self.follow_frames(arrow_a, arrow_lengths[:, 0], frame, about_point=bloch1.get_center())
+        self.follow_frames(arrow_b, arrow_lengths[:, 1], frame, about_point=bloch2.get_center())
+        self.play(frame.animate.set_value(len(arrow_lengths) - 1), run_time=2)
+        for mob in (sphere1, sphere2, arrow_a, arrow_b):
+            mob.clear_updaters()
         self.wait(1)
 
         # Draw entanglement line
@@ -69,13 +81,51 @@ class EPRPairGeneration(ThreeDScene):
         # self.play(Write(epr_text))
         # self.wait(3)
 
+    def entangling_trajectory(self, frames):
+        """Per-frame (Bloch length, purity) of both qubits while the CNOT entangles them, each shape (frames, 2).
+
+        Ramping the CNOT as a controlled-RX(theta), theta: 0 -> pi, and tracing out the partner
+        leaves qubit A (|+>) phase damped by sin^2(theta / 2) and qubit B (|0>) in an even mix of
+        |0> and RX(theta)|0>.
+        """
+        thetas = np.linspace(0, PI, frames)
+        plus = np.full((2, 2), 0.5, dtype=complex)
+        zero = np.diag([1, 0]).astype(complex)
+        rho_a = channel_trajectory(plus, superoperator(phase_damping_kraus(np.sin(thetas / 2) ** 2)))
+        rotations = np.stack([rx(theta) for theta in thetas])
+        rho_b = channel_trajectory(zero, superoperator(mixed_unitary_kraus([I, rotations], [0.5, 0.5])))
+        rhos = np.stack([rho_a, rho_b], axis=1)
+        return bloch_lengths(rhos), density_purities(rhos)
+
+    def follow_frames(self, mob, scales, frame, about_point):
+        """Keeps mob scaled to scales[frame] (relative to its current size) as the frame tracker moves"""
+        mob.frame_scale = 1.0
+
+        def update(m):
+            target = max(scales[int(round(frame.get_value()))], MIN_SCALE)
+            m.scale(target / m.frame_scale, about_point=about_point)
+            m.frame_scale = target
+
+        mob.add_updater(update)
+
+    def follow_rotation(self, mob, rotations, frame, about_point):
+        """Keeps mob turned by rotations[frame] (precomputed 3x3 matrices) as the frame tracker moves"""
+        mob.frame_rotation = np.eye(3)
+
+        def update(m):
+            target = rotations[int(round(frame.get_value()))]
+            m.apply_matrix(target @ m.frame_rotation.T, about_point=about_point)
+            m.frame_rotation = target
+
+        mob.add_updater(update)
+
     def create_bloch_sphere(self, label=""):
-        sphere = Sphere(radius=1.5, resolution=(30, 30), fill_opacity=0.1, stroke_color=WHITE)
-        axes = ThreeDAxes(x_range=[-1.8,1.8], y_range=[-1.8,1.8], z_range=[-1.8,1.8], stroke_color=GRAY)
-        label_mob = Text(label).next_to(sphere, UP)
-        return VGroup(sphere, axes, label_mob)    
+        bloch = BlochSphereView(state_vector_endpoint=None, sphere_color=WHITE, style="plain")
+        if label:
+            bloch.add(Text(label).next_to(bloch.sphere, UP))
+        return bloch
 
-    def add_bloch_vector(self, bloch_group, direction=UP):
+    def add_bloch_vector(self, bloch_group, direction=OUT):
         origin = bloch_group.get_center()
         vec = Arrow3D(start=origin, end=origin + direction*1.5, color=RED, thickness=0.03)
         self.add(vec)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from epr_example.statevector import CX, H, I
+from epr_example.trajectory import BACKENDS, get_trajectory, clear_trajectory_cache
+from epr_example.unitaries import UNITARY_BACKEND, get_unitary_trajectory
+
+
+def epr_circuit():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    return qc
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_trajectory_cache()
+    yield
+    clear_trajectory_cache()
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS.values()) + [UNITARY_BACKEND], ids=lambda b: b.name)
+def test_every_backend_runs_through_the_cache(backend):
+    trajectory = get_trajectory(epr_circuit(), backend)
+    assert trajectory is get_trajectory(epr_circuit(), backend)
+    assert np.allclose(trajectory.bloch_vectors(2), 0)  # both halves of a Bell pair are maximally mixed
+
+
+def test_unitary_trajectory_of_epr_circuit():
+    trajectory = get_unitary_trajectory(epr_circuit())
+    assert np.allclose(trajectory.state(0), np.eye(4))
+    assert np.allclose(trajectory.state(1), np.kron(H, I))
+    assert np.allclose(trajectory.state(2), CX @ np.kron(H, I))